@@ -0,0 +1,8 @@
+""" Benchmarks of valueparser hot paths 
+
+Run all benchmarks with:: 
+
+    python -m benchmarks 
+
+See ``python -m benchmarks --help`` for options
+"""
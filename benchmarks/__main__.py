@@ -0,0 +1,30 @@
+""" Run the benchmarks: python -m benchmarks [-k filter] [--json path] """
+import argparse
+import importlib
+
+from benchmarks._runner import dump_json, header, run_cases
+
+MODULES = ["bench_builtins", "bench_chains", "bench_construction", "bench_pydantic", "bench_import", "bench_record", "bench_bank"]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="valueparser benchmarks")
+    arg_parser.add_argument("-k", "--filter", default="", help="only run cases whose group or name contains this string")
+    arg_parser.add_argument("--min-time", type=float, default=0.2, help="minimum time (s) of one measurement")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="number of measurements, the best is kept")
+    arg_parser.add_argument("--json", default=None, help="write results to this json file")
+    args = arg_parser.parse_args(argv)
+
+    cases = []
+    for name in MODULES:
+        module = importlib.import_module(f"benchmarks.{name}")
+        cases.extend( case for case in module.cases() 
+                      if args.filter in case.group or args.filter in case.name )
+    print(header())
+    results = run_cases(cases, min_time=args.min_time, repeat=args.repeat)
+    if args.json:
+        dump_json(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+""" Minimal timeit based benchmark runner """
+from dataclasses import dataclass
+import json
+import timeit
+from typing import Callable, Iterable, List, Optional
+
+
+@dataclass
+class Case:
+    """ One benchmark case 
+
+    func and baseline are called without argument, baseline is the equivalent 
+    plain python code (None if there is no meaningful baseline)
+    """
+    group: str
+    name: str
+    func: Callable[[], object]
+    baseline: Optional[Callable[[], object]] = None
+    size: int = 1 # number of values parsed by one call 
+
+
+@dataclass
+class Result:
+    group: str
+    name: str
+    time: float # second per value 
+    baseline: Optional[float] = None # second per value 
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None:
+            return None
+        return self.time/self.baseline
+
+
+def _time_per_call(func: Callable[[], object], min_time: float, repeat: int) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number*min_time/0.2))
+    return min(timer.repeat(repeat=repeat, number=number))/number
+
+
+def run_case(case: Case, min_time: float = 0.2, repeat: int = 5) -> Result:
+    time = _time_per_call(case.func, min_time, repeat)/case.size
+    baseline = None
+    if case.baseline is not None:
+        baseline = _time_per_call(case.baseline, min_time, repeat)/case.size
+    return Result(case.group, case.name, time, baseline)
+
+
+def run_cases(cases: Iterable[Case], min_time: float = 0.2, repeat: int = 5, 
+                verbose: bool = True) -> List[Result]:
+    results = []
+    for case in cases:
+        result = run_case(case, min_time, repeat)
+        if verbose:
+            print( format_result(result), flush=True)
+        results.append(result)
+    return results
+
+
+def _format_time(t: Optional[float]) -> str:
+    if t is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if t >= scale:
+            return f"{t/scale:.3f} {unit}"
+    return f"{t/1e-9:.1f} ns"
+
+
+def format_result(result: Result) -> str:
+    ratio = "-" if result.ratio is None else f"x{result.ratio:.2f}"
+    return f"{result.group:<14} {result.name:<44} {_format_time(result.time):>12} {_format_time(result.baseline):>12} {ratio:>8}"
+
+
+def header() -> str:
+    return f"{'group':<14} {'case':<44} {'per value':>12} {'baseline':>12} {'ratio':>8}"
+
+
+def dump_json(results: List[Result], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump( [dict(group=r.group, name=r.name, time=r.time, baseline=r.baseline) for r in results], f, indent=2)
@@ -0,0 +1,26 @@
+""" One record of 5000 channels parsed by a ParserBank """
+from typing import List
+
+from valueparser import parser, ParserBank, Clipped, Bounded
+from benchmarks._runner import Case
+
+_N = 5000
+
+
+def cases() -> List[Case]:
+    channels = {f"ch{i}": parser( (float, Clipped), min=-i, max=i) for i in range(_N//2)}
+    channels.update( {f"b{i}": parser( (float, Bounded), min=0, max=i+1) for i in range(_N//2)} )
+    bank = ParserBank(channels)
+    record = dict.fromkeys(channels, 0.5)
+    records = [list(record.values())]*100
+    # baseline: one parse call per channel 
+    parsers = bank.parsers
+
+    def per_channel():
+        return {name: p.parse(record[name]) for name, p in parsers.items()}
+    
+    return [
+        Case("bank", "parse (one record)", lambda: bank.parse(record), per_channel, size=_N), 
+        Case("bank", "parse_array (100 records)", lambda: bank.parse_array(records), 
+             lambda: [per_channel() for _ in range(100)], size=100*_N), 
+    ]
@@ -0,0 +1,68 @@
+""" Per value cost of the builtin parsers """
+import datetime
+from enum import Enum
+from typing import List
+
+from valueparser import parsers
+from benchmarks._runner import Case
+
+
+class _Color(int, Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+_ITEMS = list(range(1000))
+_ISO = "2022-06-01T09:52:00"
+
+
+def cases() -> List[Case]:
+    clipped = parsers.Clipped(min=0, max=1)
+    bounded = parsers.Bounded(min=0, max=1)
+    rounded = parsers.Rounded(ndigits=2)
+    modulo = parsers.Modulo(modulo=3)
+    formated = parsers.Formated(format="%.3f")
+    default = parsers.Default(default=0)
+    listed = parsers.Listed(items=_ITEMS)
+    enumerated = parsers.Enumerated(enumerator=_Color)
+    error = parsers.Error(Error=_Color, UNKNOWN=_Color.RED)
+    timestamp = parsers.Timestamp()
+    date_time = parsers.DateTime()
+    to_float = parsers.Float()
+    to_int = parsers.Int()
+    dispatch = parsers.Dispatch(branches={str: float, (int, float): None})
+    cached = parsers.Cached(parser=_iso_timestamp)
+    params = bounded.__config__.__get_params__()
+
+    return [
+        Case("builtins", "Float", lambda: to_float.parse("0.5"), lambda: float("0.5")),
+        Case("builtins", "Int", lambda: to_int.parse(2.3), lambda: int(2.3)),
+        Case("builtins", "Clipped", lambda: clipped.parse(0.5), lambda: min(1, max(0, 0.5))),
+        Case("builtins", "Bounded", lambda: bounded.parse(0.5), lambda: 0<=0.5<=1),
+        Case("builtins", "Rounded", lambda: rounded.parse(0.123), lambda: round(0.123, 2)),
+        Case("builtins", "Modulo", lambda: modulo.parse(7), lambda: 7%3),
+        Case("builtins", "Formated", lambda: formated.parse(0.5), lambda: "%.3f"%(0.5,)),
+        Case("builtins", "Default", lambda: default.parse(None), lambda: 0 if None is None else None),
+        Case("builtins", "Listed (1000 items)", lambda: listed.parse(999), lambda: 999 in _ITEMS),
+        Case("builtins", "Enumerated", lambda: enumerated.parse(2), lambda: _Color(2)),
+        Case("builtins", "Error (unknown value)", lambda: error.parse(99), _error_baseline),
+        Case("builtins", "Timestamp (ISO string)", lambda: timestamp.parse(_ISO), 
+             lambda: datetime.datetime.fromisoformat(_ISO).timestamp()), 
+        Case("builtins", "DateTime (ISO string)", lambda: date_time.parse(_ISO), 
+             lambda: datetime.datetime.fromisoformat(_ISO)), 
+        Case("builtins", "Dispatch (str)", lambda: dispatch.parse("0.5"), lambda: float("0.5")), 
+        Case("builtins", "Cached (hit)", lambda: cached.parse(_ISO), lambda: _iso_timestamp(_ISO)), 
+        # the frozen parameters given to __parse__ shall not be slower than the pydantic configuration 
+        Case("params", "field of the frozen parameters", lambda: params.min, lambda: bounded.__config__.min), 
+    ]
+
+
+def _iso_timestamp(value):
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def _error_baseline():
+    try:
+        return _Color(99)
+    except ValueError:
+        return _Color.RED
@@ -0,0 +1,66 @@
+""" Combined parsers of various length, single value, batch, compiled and array """
+import array as array_module
+from typing import List
+
+from valueparser import parser_class, Clipped, Bounded, Rounded, Modulo
+from benchmarks._runner import Case
+
+try:
+    import numpy as np
+except ImportError:
+    np = None 
+
+_N = 10000
+_VALUES = [i/_N for i in range(_N)]
+
+
+def _hand_written(value):
+    value = float(value)
+    value = min(1.0, max(0.0, value))
+    if value<0.0 or value>1.0:
+        raise ValueError(value)
+    return round(value, 2)
+
+
+def _parser(spec):
+    Parser = parser_class(spec)
+    parameters = dict(min=0.0, max=1.0, ndigits=2, modulo=10)
+    return Parser( **{k:v for k,v in parameters.items() if k in Parser.Config.__fields__} )
+
+
+def cases() -> List[Case]:
+    chains = {
+        1: (float,), 
+        2: (float, Clipped), 
+        3: (float, Clipped, Rounded), 
+        4: (float, Clipped, Bounded, Rounded), 
+        5: (float, Clipped, Bounded, Modulo, Rounded), 
+    }
+    result = []
+    for n, spec in chains.items():
+        p = _parser(spec)
+        result.append( Case("chain", f"parse, {n} stages", lambda p=p: p.parse(0.5), lambda: _hand_written(0.5)) )
+    
+    p = _parser(chains[4])
+    f = p.compile()
+    result.append( Case("chain", "compiled, 4 stages", lambda: f(0.5), lambda: _hand_written(0.5)) )
+    result.append( Case("chain", "parse_many, 4 stages", lambda: p.parse_many(_VALUES), 
+                        lambda: [_hand_written(v) for v in _VALUES], size=_N) )
+    result.append( Case("chain", "try_parse, 4 stages", lambda: p.try_parse(0.5), lambda: _hand_written(0.5)) )
+    result.append( Case("chain", "try_parse rejected, 4 stages", lambda: p.try_parse("x"), lambda: _try_hand_written("x")) )
+    if np is not None:
+        array = np.asarray(_VALUES)
+        result.append( Case("chain", "parse_array, 4 stages", lambda: p.parse_array(array), 
+                            lambda: [_hand_written(v) for v in _VALUES], size=_N) )
+        source = array_module.array("d", _VALUES)
+        out = array_module.array("d", _VALUES)
+        result.append( Case("chain", "parse_into, 4 stages", lambda: p.parse_into(source, out), 
+                            lambda: [_hand_written(v) for v in _VALUES], size=_N) )
+    return result
+
+
+def _try_hand_written(value):
+    try:
+        return (True, _hand_written(value))
+    except ValueError as err:
+        return (False, err)
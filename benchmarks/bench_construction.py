@@ -0,0 +1,47 @@
+""" Construction of parser classes, parsers and factories """
+from typing import List
+
+from valueparser import parser, parser_class, parser_class_cache, parser_pool, ParserFactory, Clipped, Rounded
+from benchmarks._runner import Case
+
+
+class _Plain:
+    """ baseline: a plain python object holding the same parameters """
+    def __init__(self, min=0.0, max=1.0, ndigits=2):
+        self.min, self.max, self.ndigits = min, max, ndigits
+
+
+def _uncached_parser_class():
+    parser_class_cache.clear()
+    return parser_class( (float, Clipped, Rounded) )
+
+
+def _interned(func):
+    """ run func with the parser pool enabled, a first interned parser is kept alive by the closure """
+    with parser_pool.interning():
+        shared = func()
+    def run():
+        parser_pool.enabled = True
+        try:
+            return func()
+        finally:
+            parser_pool.enabled = False
+    run.shared = shared
+    return run
+
+
+def cases() -> List[Case]:
+    factory = ParserFactory(type=[float, Clipped, Rounded], min=0, max=1, ndigits=2)
+    return [
+        Case("construction", "parser_class (cached)", lambda: parser_class( (float, Clipped, Rounded) )), 
+        Case("construction", "parser_class (not cached)", _uncached_parser_class), 
+        Case("construction", "parser() combined", lambda: parser( (float, Clipped, Rounded), min=0, max=1, ndigits=2), 
+             lambda: _Plain(0, 1, 2)), 
+        Case("construction", "builtin instance", lambda: Clipped(min=0, max=1), lambda: _Plain(0, 1)), 
+        Case("factory", "ParserFactory validation", 
+             lambda: ParserFactory(type=[float, Clipped, Rounded], min=0, max=1, ndigits=2), lambda: _Plain(0, 1, 2)), 
+        Case("factory", "ParserFactory.build", factory.build, lambda: _Plain(0, 1, 2)), 
+        Case("interning", "parser() combined, interned", 
+             _interned(lambda: parser( (float, Clipped, Rounded), min=0, max=1, ndigits=2)), lambda: _Plain(0, 1, 2)), 
+        Case("interning", "ParserFactory.build, interned", _interned(factory.build), lambda: _Plain(0, 1, 2)), 
+    ]
@@ -0,0 +1,25 @@
+""" Import time, measured in a new interpreter 
+
+The baseline imports the engine, the builtin parsers and numpy up front, as before 
+they were imported lazily. ``python -c pass`` gives the interpreter start up time.
+"""
+import subprocess
+import sys
+from typing import List
+
+from benchmarks._runner import Case
+
+
+def _run_python(code: str):
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def cases() -> List[Case]:
+    eager = _run_python("import numpy; import valueparser.engine; import valueparser.parsers")
+    return [
+        Case("import", "interpreter start up", _run_python("pass")), 
+        Case("import", "import valueparser", _run_python("import valueparser"), eager), 
+        Case("import", "import engine", _run_python("import valueparser.engine"), eager), 
+        Case("import", "first parser", _run_python("import valueparser; valueparser.parser('int')"), eager), 
+        Case("import", "builtin parsers", _run_python("from valueparser import Clipped, Int"), eager), 
+    ]
@@ -0,0 +1,38 @@
+""" conparser fields inside pydantic models """
+from typing import List
+
+from pydantic import BaseModel, validator
+from valueparser import conparser, Clipped, Bounded
+from benchmarks._runner import Case
+
+Ratio = conparser( (float, Clipped), min=0, max=1)
+Pixel = conparser( (int, Bounded), min=0, max=1023)
+
+
+class _Model(BaseModel):
+    x: Pixel = 0
+    y: Pixel = 0
+    ratio: Ratio = 0.0
+
+
+class _Baseline(BaseModel):
+    x: int = 0
+    y: int = 0
+    ratio: float = 0.0
+
+    @validator("x", "y")
+    def _check_pixel(cls, value):
+        if not 0<=value<=1023:
+            raise ValueError(value)
+        return value
+    
+    @validator("ratio")
+    def _clip(cls, value):
+        return min(1.0, max(0.0, value))
+
+
+def cases() -> List[Case]:
+    payload = {"x": "12", "y": 512, "ratio": "1.5"}
+    return [
+        Case("pydantic", "model with 3 conparser fields", lambda: _Model(**payload), lambda: _Baseline(**payload)), 
+    ]
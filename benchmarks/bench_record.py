@@ -0,0 +1,29 @@
+""" Records of three fields, per record and columnar """
+from enum import Enum
+from typing import List
+
+from valueparser import parser, RecordParser, Clipped, Enumerated
+from benchmarks._runner import Case
+
+
+class _State(Enum):
+    OFF = 0
+    ON = 1
+
+_N = 1000
+_ROWS = [(str(i/_N), "ON", str(i)) for i in range(_N)]
+
+
+def cases() -> List[Case]:
+    fields = {"x": (float, Clipped(min=0, max=1)), "state": Enumerated(enumerator=_State, names=True), "n": int}
+    record_parser = RecordParser(fields)
+    # baseline: one parser per field and a python loop 
+    field_parsers = [(name, parser(spec)) for name, spec in fields.items()]
+
+    def per_field():
+        return [ {name: p.parse(value) for (name, p), value in zip(field_parsers, row)} for row in _ROWS]
+    
+    return [
+        Case("record", "parse (per record)", lambda: [record_parser.parse(row) for row in _ROWS], per_field, size=_N), 
+        Case("record", "parse_many (columnar)", lambda: record_parser.parse_many(_ROWS), per_field, size=_N), 
+    ]
@@ -0,0 +1,54 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest 
+from valueparser import ParseError, parser, Bounded, Clipped
+
+
+async def agen(values, delay=0.0):
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+async def collect(aiterator):
+    return [value async for value in aiterator]
+
+
+def test_aparse():
+    p = parser( (float, Clipped), min=0, max=10)
+    assert asyncio.run( p.aparse("20") ) == 10.0
+    assert asyncio.run( parser(int).aparse("2") ) == 2
+    
+    async def in_executor():
+        with ThreadPoolExecutor(1) as executor:
+            return await p.aparse("5", executor=executor)
+    assert asyncio.run( in_executor() ) == 5.0
+
+def test_aparse_iter():
+    p = parser( (float, Clipped), min=0, max=10)
+    values = [str(i) for i in range(25)]
+    expected = p.parse_many(values)
+    assert asyncio.run( collect( p.aparse_iter( agen(values), batch_size=4) ) ) == expected
+    assert asyncio.run( collect( p.aparse_iter( values, batch_size=4) ) ) == expected
+
+def test_aparse_iter_executor():
+    p = parser( (float, Clipped), min=0, max=10)
+    values = [str(i) for i in range(25)]
+    
+    async def in_executor():
+        with ThreadPoolExecutor(2) as executor:
+            return await collect( p.aparse_iter( agen(values), batch_size=3, executor=executor, max_pending=3) )
+    assert asyncio.run( in_executor() ) == p.parse_many(values)
+
+def test_aparse_iter_max_delay():
+    p = parser(int)
+    
+    async def first_batch():
+        async for value in p.aparse_iter( agen(["1", "2", "3"], delay=0.05), batch_size=100, max_delay=0.01):
+            return value 
+    assert asyncio.run( first_batch() ) == 1
+    assert asyncio.run( collect( p.aparse_iter( agen(["1", "2", "3"], delay=0.01), batch_size=2, max_delay=0.001) ) ) == [1, 2, 3]
+
+def test_aparse_iter_error():
+    p = Bounded(max=1)
+    with pytest.raises(ParseError):
+        asyncio.run( collect( p.aparse_iter( agen([0, 2]) ) ) )
@@ -0,0 +1,58 @@
+from enum import Enum
+import pickle
+import numpy as np
+import pytest 
+from valueparser import Bounded, Clipped, Enumerated, Errors, ParserBank, RecordError, Rounded, parser
+
+
+class State(Enum):
+    OFF = 0
+    ON = 1
+
+@pytest.fixture
+def bank():
+    channels = {f"x{i}": parser( (float, Clipped), min=-i, max=i) for i in range(10)}
+    channels["y"] = parser( (float, Bounded), max=1.0)
+    channels["z"] = parser( (float, Rounded), ndigits=1)
+    channels["state"] = Enumerated(enumerator=State)
+    return ParserBank(channels)
+
+
+def test_bank_groups(bank):
+    assert len(bank) == 13 
+    assert len(bank.groups) == 4 
+    assert "10 x Parser" in bank.explain() and "per channel min, max" in bank.explain()
+
+def test_bank_parse(bank):
+    record = {**{f"x{i}": "2.5" for i in range(10)}, "y": 0.5, "z": 0.26, "state": 1}
+    parsed = bank.parse(record)
+    assert list(parsed) == list(bank.channels)
+    assert parsed == {name: p.parse(record[name]) for name, p in bank.parsers.items()}
+    assert parsed["x1"] == 1.0 and parsed["x9"] == 2.5 and parsed["state"] == State.ON 
+    assert bank.parse( list(record.values()) ) == parsed 
+    assert pickle.loads(pickle.dumps(bank)).parse(record) == parsed 
+
+def test_bank_errors(bank):
+    record = {**{f"x{i}": 0.0 for i in range(10)}, "y": 2.0, "state": 5}
+    with pytest.raises(RecordError) as err:
+        bank.parse(record)
+    errors = err.value.errors 
+    assert list(errors) == ["y", "z", "state"]
+    assert errors["y"].error_code == Errors.OUT_OF_BOUND
+    assert errors["z"].error_code == Errors.MISSING_FIELD
+
+def test_bank_parse_array(bank):
+    records = np.array([ [2.5]*10+[0.5, 0.26, 1], [-3.0]*10+[0.0, 1.0, 0]])
+    parsed = bank.parse_array(records)
+    assert parsed.shape == (2,)
+    assert parsed.dtype.names == bank.channels
+    assert list(parsed["x2"]) == [2.0, -2.0]
+    assert list(parsed["state"]) == [State.ON, State.OFF]
+    records[1, 10] = 2.0 
+    with pytest.raises(RecordError) as err:
+        bank.parse_array(records)
+    assert list(err.value.errors) == ["y"]
+    
+    bank = ParserBank({f"x{i}": parser( (float, Clipped), min=-i, max=i) for i in range(10)})
+    parsed = bank.parse_array( {f"x{i}": [5.0, -5.0] for i in range(10)} )
+    assert list(parsed["x3"]) == [3.0, -3.0]
@@ -1,7 +1,9 @@
 import pytest 
-from enum import Enum
+from enum import Enum, Flag
 import datetime
-from valueparser import ParseError, parser
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+from valueparser import BaseParser, ParseError, Errors, ParserFactory, parser, parser_class
 from valueparser import Bounded
 from valueparser import Clipped
 from valueparser import Listed
@@ -10,7 +12,7 @@ from valueparser import Rounded
 from valueparser import Formated
 from valueparser import Modulo
 from valueparser import Default, Int
-from valueparser.parsers import DateTime, Error, Timestamp
+from valueparser.parsers import DateTime, Error, Timestamp, Dispatch, Cached
 
 
 
@@ -52,6 +54,26 @@ def test_listed_parser():
     p = Listed( items=list("ABCDEF"), default_item="Z")
     assert p.parse("W") == "Z"
 
+def test_listed_parser_index():
+    p = Listed( items=[1, 2.5, "a", [1,2], {"b":1}] )
+    assert p.parse(1.0) == 1
+    assert p.parse("a") == "a"
+    assert p.parse([1,2]) == [1,2]
+    assert p.parse({"b":1}) == {"b":1}
+    with pytest.raises( ParseError ):
+        p.parse([3])
+    with pytest.raises( ParseError ):
+        p.parse(3)
+    
+    p.__config__.items = [3]
+    assert p.parse(3) == 3
+    
+    p = Listed( items=list(range(1000)))
+    assert p.parse(999) == 999
+    with pytest.raises( ParseError ) as exc:
+        p.parse(1000)
+    assert "990 more" in str(exc.value)
+
 
 def test_enumerated_parser():
     class E(int, Enum):
@@ -61,6 +83,46 @@ def test_enumerated_parser():
         
     p = Enumerated(enumerator=E)
     assert p.parse(1) == 1 
+    assert p.parse(2) is E.B
+    with pytest.raises( ParseError):
+        p.parse(4)
+    with pytest.raises( ParseError):
+        p.parse("A")
+    assert p.parse_many( iter([1, 3]) ) == [E.A, E.C]
+    with pytest.raises( ParseError):
+        p.parse_many( [1, 4] )
+
+def test_enumerated_parser_names():
+    class E(str, Enum):
+        A = "alpha"
+        B = "beta"
+    p = Enumerated(enumerator=E, names=True)
+    assert p.parse("A") is E.A
+    assert p.parse("beta") is E.B
+    with pytest.raises( ParseError):
+        p.parse("ALPHA")
+    p = Enumerated(enumerator=E, names=True, ignore_case=True)
+    assert p.parse("ALPHA") is E.A
+    assert p.parse("b") is E.B
+
+def test_enumerated_plain_enum_members():
+    class E(Enum):
+        A = 1
+        B = "b"
+    p = Enumerated(enumerator=E)
+    assert p.parse(E.A) is E.A and p.parse(1) is E.A
+    assert p.parse_many( [E.B, "b"] ) == [E.B, E.B]
+    assert Enumerated(enumerator=E, names=True).parse(E.B) is E.B
+    assert Error(Error=E).parse(E.A) is E.A
+    with pytest.raises( ParseError):
+        p.parse("A")
+
+def test_enumerated_flag():
+    class F(Flag):
+        A = 1
+        B = 2 
+    p = Enumerated(enumerator=F)
+    assert p.parse(3) == F.A|F.B
 
 
 def test_rounded_parser():
@@ -99,6 +161,24 @@ def test_timestamp():
     assert p.parse( '1970-01-01T01:00:00') == 0.0 
     assert p.parse( 1.0 ) == 1.0
 
+def test_timestamp_array():
+    np = pytest.importorskip("numpy")
+    p = Timestamp(time_offset=1.0)
+    assert p.parse_array( ['1970-01-01T01:00:00+01:00', '1970-01-01T01:00:01+01:00', '1970-01-01T01:00:00+01:00'] ).tolist() == [1.0, 2.0, 1.0]
+    assert p.parse_array( [1, 2] ).tolist() == [2.0, 3.0]
+    t0 = datetime.datetime( 1970, 1, 1, 1).timestamp() # local time 
+    out = p.parse_array( np.array([datetime.datetime( 1970, 1, 1, 1), '1970-01-01T01:00:00', 3.0], dtype=object) )
+    assert out.tolist() == [t0+1.0, t0+1.0, 4.0]
+
+def test_datetime_array():
+    np = pytest.importorskip("numpy")
+    p = DateTime()
+    out = p.parse_array( ['1970-01-01T01:00:00', '2000-01-01T00:00:00'] )
+    assert out.dtype == np.dtype("datetime64[us]")
+    assert out.tolist() == [datetime.datetime( 1970, 1, 1, 1), datetime.datetime( 2000, 1, 1)] 
+    with pytest.raises(ValueError):
+        p.parse_array( ['1970-01-01T01:00:00+01:00'] )
+
 def test_datetime():
     p = DateTime()
     d = datetime.datetime( 1970, 1, 1, 1)
@@ -118,5 +198,238 @@ def test_error():
     p = Error( Error=E)
     with pytest.raises( ValueError):
         p.parse(10)
+    
+    p = Error( Error=E, UNKNOWN=E.UNKNOWN)
+    assert p.parse_many( [1, 10, 2] ) == [E.BAD_VALUE, E.UNKNOWN, E.BAD_KEY]
+
+
+
+
+def test_parse_array():
+    np = pytest.importorskip("numpy")
+    p = parser( (float, Clipped, Rounded), min=0, max=1.0, ndigits=2)
+    assert p.parse_array( ["0.2345", "4", "-1"] ).tolist() == [0.23, 1.0, 0.0]
+    
+    p = parser( (Int, Modulo), modulo=3)
+    out = p.parse_array( np.array([1.2, 4.0, 5.5]) )
+    assert out.dtype.kind == "i"
+    assert out.tolist() == [1, 1, 2]
+
+    p = Bounded( min=0, max=10)
+    assert p.parse_array( [1, 2] ).tolist() == [1, 2]
+    with pytest.raises(ParseError):
+        p.parse_array( [1, 12] )
+    
+    assert Clipped().parse_array( np.array([1, 2]) ).dtype.kind == "i"
+    assert Rounded( ndigits=None).parse_array([1.2, 2.7]).tolist() == [1, 3]
+    with pytest.raises(ValueError):
+        Rounded( ndigits=None).parse_array([1.2, float("nan")])
+    # out of the int64 range, values are python integers as in parse 
+    assert Rounded( ndigits=None).parse_array([1e30, 2.6]).tolist() == [round(1e30), 3]
+    assert parser( (int,) ).parse_array([1e30, -3e19]).tolist() == [int(1e30), int(-3e19)]
+    
+    # NaN is clipped to min as in parse and compile 
+    p = Clipped(min=0, max=1)
+    assert p.parse_array( [0.5, float("nan")] ).tolist() == [0.5, 0.0] == [p.parse(0.5), p.parse(float("nan"))]
+    assert p.compile()(float("nan")) == 0.0
+
+def test_parse_array_fallback():
+    pytest.importorskip("numpy")
+    p = parser( (float, Clipped, Formated), max=1.0, format="%.1f")
+    assert p.parse_array( [0.5, 2] ).tolist() == ["0.5", "1.0"]
+    assert parser( lambda x: x*2).parse_array( [1, 2] ).tolist() == [2, 4]
+
+def test_compile():
+    p = parser( (float, Clipped, Rounded, Bounded, Formated), min=0, max=1.0, ndigits=2, format="%.2f")
+    f = p.compile()
+    assert f("0.2345") == p.parse("0.2345") == "0.23"
+    assert f(4) == "1.00"
+    
+    f = parser( (Default, Modulo), default=5, modulo=3).compile()
+    assert f(None) == 2
+    assert f(4) == 1
+
+    f = Bounded(max=3).compile()
+    with pytest.raises(ParseError):
+        f(5)
+
+def test_parse_iter():
+    p = parser( (float, Bounded), min=0, max=10)
+    values = (v for v in ["1", 20, "x", 3, -1])
+    with pytest.raises( ParseError):
+        list( p.parse_iter( ["1", 20] ) )
+    delivered = []
+    with pytest.raises( ParseError):
+        for value in p.parse_iter( ["1", "2", 20, "3"] ):
+            delivered.append(value)
+    assert delivered == [1.0, 2.0]
+    
+    assert list( p.parse_iter( values, on_error="skip", chunk_size=2) ) == [1.0, 3.0]
+    assert list( p.parse_iter( ["1", 20, "x"], on_error="default", default=-99) ) == [1.0, -99, -99]
+    
+    errors = []
+    assert list( p.parse_iter( ["1", 20, "x", 3, -1], on_error="collect", errors=errors, chunk_size=2) ) == [1.0, 3.0]
+    assert errors == [ (1, Errors.OUT_OF_BOUND, 20), (2, None, "x"), (4, Errors.OUT_OF_BOUND, -1)]
+    
+    assert list( parser(int).parse_iter( ["1", "a"], on_error="skip") ) == [1]
+    with pytest.raises( ValueError):
+        p.parse_iter( [], on_error="collect")
+    with pytest.raises( ValueError):
+        p.parse_iter( [], on_error="ignore")
+
+def test_pickle_parsers():
+    p = parser( (float, "Clipped", Rounded), max=1.0, ndigits=2)
+    p2 = pickle.loads( pickle.dumps(p) )
+    assert p2.parse("0.1234") == 0.12
+    assert p2.parse("3") == 1.0
+    assert type(p2) is type(p)
+    
+    assert pickle.loads( pickle.dumps( Bounded(max=1) ) ).__config__.max == 1
+    assert pickle.loads( pickle.dumps( Int() ) ).__class__ is Int
+    assert pickle.loads( pickle.dumps( parser(int) ) ).parse("2") == 2
+    assert pickle.loads( pickle.dumps( parser_class(Clipped, "Named")(max=1) ) ).parse(2) == 1
+
+def test_parse_parallel():
+    p = parser( (float, Clipped), max=1.0)
+    values = [str(i/10) for i in range(30)]
+    assert p.parse_parallel( values, workers=2, chunk_size=7) == p.parse_many(values)
+    with ThreadPoolExecutor(2) as executor:
+        assert p.parse_parallel( values, chunk_size=7, executor=executor) == p.parse_many(values)
+    
+    p = parser( (float, Bounded), max=1.0)
+    with pytest.raises(ParseError) as err:
+        p.parse_parallel( values, workers=2, chunk_size=7)
+    assert err.value.error_code == Errors.OUT_OF_BOUND
+    err = pickle.loads( pickle.dumps( ParseError(Errors.OUT_OF_BOUND, "{} is higher than {}", 2, 1)) )
+    assert str(err) == "2 is higher than 1" and err.error_code == Errors.OUT_OF_BOUND
+
+def test_parse_error_in_pydantic():
+    from pydantic import BaseModel, ValidationError
+    from valueparser import conparser
+    class M(BaseModel):
+        x: conparser( (float, Bounded), max=1.0) = 0.0
+    with pytest.raises(ValidationError) as err:
+        M(x=2)
+    error, = err.value.errors()
+    assert error["msg"] == "2.0 is higher than 1.0"
+    assert error["ctx"] == {"error_code": Errors.OUT_OF_BOUND}
+
+def test_try_parse():
+    p = parser( (float, Bounded, Rounded), min=0, max=10)
+    assert p.try_parse("2.4") == (True, 2.0)
+    ok, err = p.try_parse("20")
+    assert not ok 
+    assert isinstance(err, ParseError) and err.error_code is Errors.OUT_OF_BOUND
+    assert str(err) == "20.0 is higher than 10.0"
+    ok, err = p.try_parse("x")
+    assert not ok and isinstance(err, ValueError)
+    
+    assert Listed(items=[1,2]).try_parse(3)[0] is False 
+    assert Listed(items=[1,2], default_item=0).try_parse(3) == (True, 0)
+    assert parser(int).try_parse("x")[0] is False
+    ok, err = Bounded(max=1).try_parse("x")
+    assert not ok and isinstance(err, TypeError)
+    assert list( Bounded(max=1).parse_iter( [0, "x", 2, 1], on_error="skip") ) == [0, 1]
+    
+def test_parse_error_message():
+    err = ParseError(Errors.OUT_OF_BOUND, "{} is lower than {}", 1, 2)
+    assert str(err) == "1 is lower than 2"
+    assert repr(err) == "ParseError('1 is lower than 2')"
+    assert str(ParseError(Errors.OUT_OF_BOUND, "bad value {}")) == "bad value {}"
+
+def test_dispatch():
+    class E(Enum):
+        A = 1
+    p = Dispatch( branches={ (int, float): (float, Clipped(max=1.0)), str: Enumerated(enumerator=E, names=True), 
+                             type(None): None } )
+    assert p.parse(3) == 1.0
+    assert p.parse(True) == 1.0 # bool resolved by the int branch
+    assert p.parse("A") is E.A
+    assert p.parse(None) is None 
+    assert p.parse_many( [0.5, "A"] ) == [0.5, E.A]
+    
+    with pytest.raises(ParseError) as err:
+        p.parse( [1] )
+    assert err.value.error_code == Errors.UNEXPECTED_TYPE
+    assert "list" in str(err.value)
+    assert p.try_parse( [1] )[0] is False
+    
+    p = parser( (Dispatch, Clipped), branches={str: float, object: None}, min=0)
+    assert p.parse("-3") == 0
+    assert p.parse(5) == 5
 
+    with pytest.raises(ValueError):
+        Dispatch( branches={"int": int} ).parse(1)
+
+def test_cached():
+    calls = []
+    def to_float(value):
+        calls.append(value)
+        return float(value)
+    
+    p = parser( to_float, cache=2 )
+    assert isinstance(p, Cached)
+    assert p.parse_many( ["1", "1", "2", "3", "1"] ) == [1.0, 1.0, 2.0, 3.0, 1.0]
+    assert calls == ["1", "2", "3", "1"] # "1" evicted by "3"
+    assert p.cache_info() == (1, 4, 2, 2, 2)
+    assert p.parse(1) == 1.0 and p.parse(True) == 1.0 # cached by type and value 
+    assert p.try_parse( [1.0] )[0] is False # unhashable, not cached
+    p.cache_clear()
+    assert p.cache_info() == (0, 0, 0, 2, 0)
+    
+    p = parser( (parser(to_float), Clipped), max=1.0, cache={'cache_errors':True, 'ttl':60.0})
+    calls.clear()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            p.parse("x")
+        assert p.parse("4") == 1.0
+    assert p.try_parse("x")[0] is False 
+    assert calls == ["x", "4"]
+    
+    class WithCacheField(BaseParser):
+        class Config:
+            cache: int = 0 
+    # cache is given to the parser own cache field 
+    assert parser(WithCacheField, cache=5).__config__.cache == 5
+    assert parser( (float, WithCacheField), cache=5).__config__.cache == 5
+    assert ParserFactory(WithCacheField, cache=5).build().__config__.cache == 5
+    assert not isinstance( parser( (float, Clipped), cache=False), Cached)
+    
+    p = Cached( parser=(float, Clipped(max=1.0)), ttl=0.0 ) # expired immediately 
+    p.parse("3"); p.parse("3")
+    assert p.cache_info().hits == 0
+    p.__config__.maxsize = 0 # new configuration, new cache 
+    p.parse("3"); p.parse("3")
+    assert p.cache_info() == (0, 2, 0, 0, 0)
 
+def test_parse_into():
+    np = pytest.importorskip("numpy")
+    import array 
+    values = array.array("d", [0.5, 2.0, -1.0, float("nan"), 0.123456])
+    out, rejected = parser( (float, Bounded, Rounded), min=0, max=1, ndigits=2).parse_into(values) # in place 
+    assert values.tolist()[:3] == [0.5, 2.0, -1.0] and values[4] == 0.12
+    assert rejected.tolist() == [False, True, True, False, False]
+    assert np.shares_memory(out, np.asarray(memoryview(values)))
+    
+    source = memoryview( np.array([1.7, -2.5, 3.9, np.inf]).tobytes() ).cast("d")
+    destination = array.array("i", [0]*4)
+    _, rejected = parser( (Int, Clipped), min=-2, max=3).parse_into(source, destination)
+    assert destination.tolist()[:3] == [1, -2, 3]
+    assert rejected.tolist() == [False, False, False, True]
+    
+    # values not fitting in the output type are rejected 
+    destination = array.array("i", [0]*4)
+    _, rejected = parser(int).parse_into( array.array("d", [1e30, 3e9, -2.0**31, 2.0**31-0.5]), destination)
+    assert rejected.tolist() == [True, True, False, False]
+    assert destination.tolist()[2:] == [-2**31, 2**31-1]
+    _, rejected = parser(int).parse_into( np.array([1e30, -2.0**63, 2.0**63]), np.zeros(3, dtype="int64"))
+    assert rejected.tolist() == [True, False, True]
+    _, rejected = parser(int).parse_into( np.array([2**40, -1, 7]), np.zeros(3, dtype="uint8"))
+    assert rejected.tolist() == [True, True, False]
+    
+    assert Modulo(modulo=3).parse_into( array.array("i", [4, 5, 7]) )[0].tolist() == [1, 2, 1]
+    
+    with pytest.raises(TypeError):
+        Timestamp().parse_into( array.array("d", [0.0]) )
+    with pytest.raises(ValueError):
+        Clipped().parse_into( b"abc" ) # read-only 
@@ -0,0 +1,61 @@
+import pytest 
+from valueparser import Bounded, Clipped, Rounded, parser
+
+np = pytest.importorskip("numpy")
+
+
+def test_parse_npy_file(tmp_path):
+    source, destination = tmp_path/"values.npy", tmp_path/"parsed.npy"
+    values = np.linspace(-1, 2, 1001)
+    np.save(source, values)
+    p = parser( (float, Clipped, Rounded), min=0, max=1, ndigits=2)
+    
+    result = p.parse_file(source, chunk_size=100, out=destination)
+    assert isinstance(result, np.memmap)
+    assert np.array_equal( np.load(destination), p.parse_array(values) )
+    assert np.array_equal( p.parse_file(source, chunk_size=100), p.parse_array(values) )
+    
+    p.parse_file(source, out=source) # in place 
+    assert np.array_equal( np.load(source), p.parse_array(values) )
+
+def test_parse_binary_file(tmp_path):
+    source = tmp_path/"values.bin"
+    np.arange(12, dtype="int32").tofile(source)
+    p = parser( (float, Bounded), max=5)
+    
+    with pytest.raises(ValueError, match="at index 6"):
+        p.parse_file(source, dtype="int32", chunk_size=5)
+    with pytest.raises(ValueError):
+        p.parse_file(source)  # dtype is missing 
+    
+    errors = []
+    result = p.parse_file(source, dtype="int32", chunk_size=5, out_dtype="float32", on_error="default", 
+                          default=-1, errors=errors)
+    assert result.dtype == np.float32
+    assert result.tolist() == [0, 1, 2, 3, 4, 5] + [-1]*6
+    assert errors == list(range(6, 12))
+
+def test_parse_file_in_place_rejected(tmp_path):
+    source = tmp_path/"values.bin"
+    values = np.arange(12, dtype="float64")+0.25
+    values.tofile(source)
+    p = parser( (float, Rounded, Bounded), ndigits=0, max=10) 
+    with pytest.raises(ValueError, match="at index 11"):
+        p.parse_file(source, dtype="float64", out=source, chunk_size=5)
+    assert np.array_equal( np.fromfile(source, dtype="float64"), values ) # unchanged 
+    with pytest.raises(ValueError, match="at index 11"):
+        p.parse_file(source, dtype="float64", out=source)
+    assert np.array_equal( np.fromfile(source, dtype="float64"), values )
+    
+    p.__config__.max = 11
+    p.parse_file(source, dtype="float64", out=source, chunk_size=5)
+    assert np.fromfile(source, dtype="float64").tolist() == list(range(12))
+
+def test_parse_file_without_parse_into(tmp_path):
+    source = tmp_path/"values.bin"
+    np.arange(12, dtype="float64").tofile(source)
+    p = parser( ("Timestamp", Bounded), max=5) # Timestamp has no __parse_into__ 
+    errors = []
+    result = p.parse_file(source, dtype="float64", chunk_size=5, on_error="default", default=-1, errors=errors)
+    assert result.tolist() == [0, 1, 2, 3, 4, 5] + [-1]*6
+    assert errors == list(range(6, 12))
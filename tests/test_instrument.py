@@ -0,0 +1,44 @@
+import json
+import pytest 
+from valueparser import BaseParser, ParseError, parser_class, Bounded, Clipped
+from valueparser.instrument import ParserStats, instrumented
+
+
+def test_instrumented_combined_parser():
+    Parser = parser_class( (float, Bounded), "Instrumented")
+    p = Parser(max=10)
+    with instrumented(sample_every=2) as stats:
+        assert p.parse("1") == 1.0
+        with pytest.raises(ParseError):
+            p.parse("20")
+        assert p.parse_many(["1", "2"]) == [1.0, 2.0]
+        assert p.try_parse("x")[0] is False
+    
+    result = stats.to_dict()["Instrumented"]
+    assert result["calls"] == 5
+    assert result["rejections"] == {"OUT_OF_BOUND": 1, "ValueError": 1}
+    assert result["samples"] == 1 # rejected calls are not timed
+    assert result["stages"]["float"]["calls"] == 5
+    assert result["stages"]["Bounded"]["calls"] == 4
+    assert result["stages"]["Bounded"]["rejections"] == {"OUT_OF_BOUND": 1}
+    assert sum(result["stages"]["Bounded"]["histogram_ns"].values()) == 1
+    json.loads( stats.to_json() )
+
+def test_instrumented_single_parser():
+    p = Clipped(max=1)
+    stats = ParserStats(sample_every=1)
+    with instrumented(stats):
+        p.parse(2)
+    assert stats.to_dict()["Clipped"]["stages"]["Clipped"]["samples"] == 1
+
+def test_instrumentation_is_removed():
+    parse = BaseParser.parse
+    with instrumented() as outer:
+        with instrumented() as inner:
+            Clipped().parse(1)
+        Clipped().parse(1)
+    assert BaseParser.parse is parse
+    assert inner.to_dict()["Clipped"]["calls"] == 1
+    assert outer.to_dict()["Clipped"]["calls"] == 1
+    Clipped().parse(1)
+    assert outer.to_dict()["Clipped"]["calls"] == 1
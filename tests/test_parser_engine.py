@@ -3,8 +3,9 @@ from typing import Optional
 from pydantic.main import BaseModel
 import pytest
 from systemy.system import BaseSystem
-from build.lib.valueparser.engine import ParserFactory
-from valueparser import BaseParser, parser, parser_class, conparser
+from valueparser.engine import ParserFactory
+from valueparser import BaseParser, parser, parser_class, conparser, parser_class_cache, parser_pool
+from valueparser import Clipped, Bounded, Rounded, Float, Default, Modulo
 from valueparser.engine import get_parser_factory_class, register_parser_factory
 
 
@@ -61,6 +62,33 @@ def test_parser_class_from_list_of_callable():
     assert Parser().parse( "3.2") == 3
 
 
+def test_parser_class_cache(MinBound, MaxBound):
+    Parser = parser_class( [float, MinBound, MaxBound] )
+    assert parser_class( (float, MinBound, MaxBound) ) is Parser
+    assert parser_class( iter([float, MinBound, MaxBound]) ) is Parser
+    assert parser_class( [float, MinBound] ) is not Parser
+    assert parser_class( [float, MinBound, MaxBound], "Named" ) is not Parser
+    assert parser_class( (int, "Clipped") ) is parser_class( (int, get_parser_factory_class("Clipped").get_system_class()) )
+    assert parser_class( int ) is parser_class( int )
+    assert parser_class( int ) is not parser_class( [int] )
+
+def test_parser_class_cache_api():
+    cache = parser_class_cache
+    cache.clear()
+    Parser = parser_class( [float, int] )
+    parser_class( [float, int] )
+    info = cache.info()
+    assert info.hits == 1 and info.misses == 1 and info.currsize == 1
+    
+    maxsize = cache.maxsize
+    try:
+        cache.resize(0)
+        assert len(cache) == 0
+        assert parser_class( [float, int] ) is not Parser
+        assert parser_class( [float, int] ) is not parser_class( [float, int] )
+    finally:
+        cache.resize(maxsize)
+
 def test_parser_class_from_list_of_base_parser(MinBound, MaxBound):
      Parser = parser_class( [MinBound, MaxBound] )
      p = Parser( min=0, max=10)
@@ -145,6 +173,39 @@ def test_parser_from_empty_list():
     assert parser([]).parse(1)==1
 
 
+def test_frozen_parameters(MinBound):
+    p = MinBound(min=1)
+    params = p.__config__.__get_params__()
+    assert params.min == 1
+    with pytest.raises(AttributeError):
+        params.min = 0
+    assert p.parse(0) == 1
+    p.__config__.min = 2
+    assert p.parse(0) == 2
+    p.reconfigure(min=3)
+    assert p.parse(0) == 3
+    assert p.__config__.__get_params__() is p.__config__.__get_params__()
+
+def test_parse_many(MinBound, MaxBound):
+    p = parser( [float, MinBound, MaxBound], min=0, max=10)
+    assert p.parse_many( ["2.3", "11", -1]) == [2.3, 10.0, 0.0]
+    assert p.parse_many( iter(["1"]) ) == [1.0]
+    assert parser( MinBound, min=1).parse_many( (0, 2) ) == [1, 2]
+    assert parser( int ).parse_many( ["1", "2"]) == [1, 2]
+    assert parser_class( int, "Int")().parse_many( [1.2, 2.3]) == [1, 2]
+    assert parser([]).parse_many( [1, 2] ) == [1, 2]
+
+def test_parse_many_with_instance_of_parser(MinBound, MaxBound):
+    p = parser( [MinBound(min=1), MaxBound], max=10)
+    assert p.parse_many( [0, 5, 20] ) == [1, 5, 10]
+
+def test_compile_custom_parser(MinBound, MaxBound):
+    p = parser( [float, MinBound(min=1), MaxBound, parser(int)], max=10)
+    f = p.compile()
+    assert f("0") == 1
+    assert f("20.5") == 10
+    assert parser(int).compile()(2.3) == 2
+
 def test_conparser_in_model(MinBound, MaxBound):
     T = conparser([int])
 
@@ -182,3 +243,105 @@ def test_register():
     assert parser((int, "P"), default=999 ).parse( 0) == 999
 
 
+
+def test_chain_optimizer():
+    p = parser( (Float, float, Clipped, Bounded, Rounded, Rounded), min=0, max=1, ndigits=1)
+    assert p.__get_stages__() == (float, Clipped, Rounded)
+    assert p.parse("3") == 1.0 and p.parse("0.33") == 0.3
+    explanation = p.explain()
+    assert "Bounded removed, redundant after Clipped" in explanation
+    assert "Rounded removed, redundant after Rounded" in explanation
+    
+    # Bounded does not make Clipped redundant, a repeated Clipped with its own configuration is kept 
+    p = parser( (float, Bounded, Clipped(max=0.5), Clipped), max=1)
+    assert len(p.__get_stages__()) == 4 
+    
+    # float modulo is not idempotent: -1e-20 % 1.0 == 1.0 and 1.0 % 1.0 == 0.0 
+    p = parser( (float, Modulo, Modulo), modulo=1.0)
+    assert len(p.__get_stages__()) == 3 
+    assert p.parse(-1e-20) == 0.0
+    
+    # a stage can be repeated in a chain 
+    p = parser( (float, Clipped, Rounded, Clipped), max=1, ndigits=1)
+    assert p.parse("1.26") == 1.0
+    
+    # no-op stages are skipped when compiled 
+    p = parser( (float, Bounded, Rounded), ndigits=2 )
+    assert "Bounded is a no-op" in p.explain()
+    assert "raise" not in p.compile().__source__
+    p.__config__.max = 1.0
+    assert "raise" in p.compile().__source__
+    # without a numeric cast before, the stage still rejects other types 
+    p = parser(Bounded)
+    assert "no-op" not in p.explain()
+    with pytest.raises(TypeError):
+        p.compile()("a")
+
+
+def test_parser_equality():
+    assert Clipped(min=0, max=1) == Clipped(min=0, max=1)
+    assert hash(Clipped(min=0, max=1)) == hash(Clipped(min=0, max=1))
+    assert Clipped(min=0, max=1) != Clipped(min=0, max=2)
+    assert Clipped(min=0, max=1) != Bounded(min=0, max=1)
+    assert Default(default=True) != Default(default=1)
+    assert parser( (float, Clipped), max=1) == parser( (float, Clipped), max=1)
+
+def test_parser_equality_of_unhashable_values():
+    np = pytest.importorskip("numpy")
+    p, q = Default(default=np.array([1, 2])), Default(default=np.array([1, 2]))
+    assert p == p and p != q # compared by identity 
+    assert {p: 1, q: 2}[q] == 2 
+
+def test_parser_hash_follows_configuration():
+    p = Clipped(min=0, max=1)
+    h = hash(p)
+    p.__config__.max = 2.0 # a parser used as key shall not be changed 
+    assert hash(p) != h and hash(p) == hash(Clipped(min=0, max=2))
+
+
+def test_parser_pool():
+    with parser_pool.interning():
+        p = parser( (float, Clipped), min=0, max=1)
+        assert parser( (float, Clipped), min=0, max=1) is p 
+        assert ParserFactory( (float, Clipped), min=0, max=1).build() is p 
+        assert parser( (float, Clipped), min=0, max=2) is not p 
+        with pytest.raises(AttributeError):
+            p.__config__.max = 2.0
+        config = p.__config__.copy()
+        config.max = 2.0 # copies are not frozen 
+    assert parser( (float, Clipped), min=0, max=1) is not p 
+    assert not parser_pool.enabled 
+
+
+def test_parser_class_cache_keys_instances_by_identity():
+    p1, p2 = Clipped(min=0, max=1), Clipped(min=0, max=1)
+    A = parser( (float, p1) )
+    B = parser( (float, p2) )
+    assert type(A) is not type(B)
+    p1.__config__.max = 100 
+    assert A.parse("50") == 50.0 
+    assert B.parse("50") == 1.0 
+
+
+def test_config_methods_in_parse():
+    class Scaled(BaseParser):
+        class Config:
+            factor: float = 2.0
+            def scale(self, value):
+                return value*self.factor
+            @property 
+            def double_factor(self):
+                return 2*self.factor 
+        @staticmethod
+        def __parse__(value, config):
+            return (config.scale(value), config.double_factor, config.dict())
+    
+    p = Scaled()
+    assert p.parse(1.0) == (2.0, 4.0, {"factor": 2.0})
+    p.__config__.factor = 3.0 
+    assert p.parse(1.0) == (3.0, 6.0, {"factor": 3.0})
+    params = p.__config__.__get_params__()
+    with pytest.raises(AttributeError):
+        params.unknown 
+    # a __getattr__ fallback would slow down the access to fields 
+    assert not hasattr(type(params), "__getattr__")
@@ -75,3 +75,20 @@ def test_factory_with_func():
             parser: Optional[ParserFactory] = []
     s = S(parser=parser((float, Clipped)))
     assert s.parser.parse("1.0") == 1.0
+
+def test_factory_build_reuses_validated_config():
+    f = ParserFactory( type=[float, Clipped], min=0, max=1)
+    p1, p2 = f.build(), f.build()
+    assert p1 is not p2 and p1.__config__ is not p2.__config__ 
+    assert p1.parse(3) == 1.0 
+
+    f.max = 5 # invalidate the validated configuration 
+    assert f.build().parse(3) == 3.0
+    assert f.copy( update={"max": 2}).build().parse(3) == 2.0
+    assert f.copy().build().parse(3) == 3.0 
+
+def test_factory_with_cache_option():
+    from valueparser import Cached 
+    p = ParserFactory( type=[float, Clipped], max=1, cache=True).build()
+    assert isinstance(p, Cached)
+    assert p.parse("3") == 1.0 
@@ -0,0 +1,74 @@
+from enum import Enum
+import io
+import pickle
+import pytest 
+from valueparser import parser, Clipped, Enumerated, Errors, ParseError, RecordError, RecordParser
+
+
+class State(Enum):
+    OFF = 0
+    ON = 1
+
+@pytest.fixture
+def record_parser():
+    return RecordParser({ "x": (float, Clipped(min=0, max=1)), "state": Enumerated(enumerator=State, names=True), "n": int})
+
+
+def test_parse_record(record_parser):
+    expected = {"x": 0.5, "state": State.ON, "n": 3}
+    assert record_parser.parse( {"x": "0.5", "state": "ON", "n": "3", "extra": None} ) == expected
+    assert record_parser.parse( ("0.5", 1, "3") ) == expected 
+    assert record_parser.parse( ["2", 0, 1] ) == {"x": 1.0, "state": State.OFF, "n": 1}
+
+def test_record_errors(record_parser):
+    with pytest.raises(RecordError) as err:
+        record_parser.parse( {"x": "a", "state": "BAD"} )
+    errors = err.value.errors
+    assert list(errors) == ["x", "state", "n"]
+    assert errors["n"].error_code == Errors.MISSING_FIELD
+    assert isinstance(err.value, ParseError) and err.value.error_code == Errors.INVALID_FIELDS
+    assert "state: 'BAD' is not a valid State" in str(err.value)
+    
+    with pytest.raises(RecordError) as err:
+        record_parser.parse( ("0.5", 1) )
+    assert list(err.value.errors) == ["n"]
+    assert record_parser.try_parse( ("0.5", 1) )[0] is False
+
+def test_parse_many_columnar(record_parser):
+    rows = [("0.5", 1, "3"), ("2", "OFF", 4)]
+    assert record_parser.parse_many(rows) == [record_parser.parse(row) for row in rows]
+    assert record_parser.parse_many( {"x": x, "state": s, "n": n} for x, s, n in rows ) == record_parser.parse_many(rows)
+    with pytest.raises(RecordError) as err:
+        record_parser.parse_many( rows+[("x", 1, 1)] )
+    assert list(err.value.errors) == ["x"]
+    
+    assert record_parser.parse_columns( {"x": ["0.5", "2"], "state": [1, 0], "n": ["3", 4]} ) == \
+        {"x": [0.5, 1.0], "state": [State.ON, State.OFF], "n": [3, 4]}
+    with pytest.raises(RecordError) as err:
+        record_parser.parse_columns( {"x": ["0.5", "a"], "state": [1, 0]} )
+    assert list(err.value.errors) == ["x", "n"]
+
+def test_parse_csv(record_parser):
+    data = "n,x,state\n1,0.2,ON\n\n2,3,OFF\n3,x,ON\n4,0.1\n"
+    errors = []
+    records = list( record_parser.parse_csv( io.StringIO(data), on_error="collect", errors=errors, chunk_size=2) )
+    assert records == [{"x": 0.2, "state": State.ON, "n": 1}, {"x": 1.0, "state": State.OFF, "n": 2}]
+    assert [(index, code) for index, code, _ in errors] == [(2, Errors.INVALID_FIELDS), (3, Errors.INVALID_FIELDS)]
+    
+    data = "0.2;ON;1\n"
+    assert list( record_parser.parse_csv( io.StringIO(data), header=False, delimiter=";") ) == records[:1]
+    
+    with pytest.raises(ValueError):
+        record_parser.parse_csv( io.StringIO("x,n\n") )
+
+def test_pickle_record_parser(record_parser):
+    assert pickle.loads( pickle.dumps(record_parser) ).parse( ("0.5", 1, "3") ) == record_parser.parse( ("0.5", 1, "3") )
+    err = pickle.loads( pickle.dumps( RecordError({"x": ValueError("bad")}) ) )
+    assert str(err) == "x: bad"
+
+def test_record_parser_follows_field_configuration():
+    record_parser = RecordParser({"x": parser( (float, Clipped), max=1)})
+    assert record_parser.parse( ("2",) ) == {"x": 1.0}
+    record_parser.parsers["x"].__config__.max = 5.0
+    assert record_parser.parse( ("2",) ) == {"x": 2.0}
+    assert record_parser.parse_many( [("2",)] ) == [{"x": 2.0}]
@@ -1,3 +1,35 @@
-from .engine import BaseParser, parser, parser_class, conparser, parser_factory_class, parser_factory, ParserFactory
-from .parsers import * 
+from importlib import import_module
 
+# Sub-modules are imported on first access of one of their objects (PEP 562),
+# ``import valueparser`` does not import pydantic, systemy or numpy
+_lazy_objects = {
+    **dict.fromkeys( [
+        "BaseParser", "parser", "parser_class", "conparser", "parser_factory_class",
+        "parser_factory", "ParserFactory", "parser_class_cache", "parser_pool", "cached_on_params"
+    ], "engine"),
+    **dict.fromkeys( [
+        "Errors", "ParseError", "Bounded", "Clipped", "Listed", "Enumerated",
+        "Default", "Rounded", "Formated", "Modulo", "Timestamp", "DateTime", "Dispatch", "Cached",
+        "Int", "Float", "Complex", "Bool", "Str", "Tuple", "Set", "List"
+    ], "parsers"),
+    **dict.fromkeys( ["RecordParser", "RecordError"], "record"),
+    **dict.fromkeys( ["ParserBank"], "bank"),
+}
+
+__all__ = list(_lazy_objects)
+
+_submodules = {"engine", "parsers"}
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return import_module("."+name, __name__)
+    try:
+        module_name = _lazy_objects[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(import_module("."+module_name, __name__), name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return sorted( set(globals()) | set(_lazy_objects) | _submodules )
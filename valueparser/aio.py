@@ -0,0 +1,125 @@
+""" Asyncio helpers to parse values without blocking the event loop """
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Union
+
+
+async def aparse(parser, value: Any, executor: Optional[Executor] = None) -> Any:
+    """ Parse one value, in the given executor if any
+
+    Args:
+        parser: any parser object
+        value: value to parse
+        executor (optional): a thread or process pool executor. If None the value
+            is parsed in the event loop thread.
+    """
+    if executor is None:
+        return parser.parse(value)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parser.parse, value)
+
+
+async def aparse_iter(
+        parser,
+        values: Union[AsyncIterable, Iterable],
+        batch_size: int = 1000,
+        executor: Optional[Executor] = None,
+        max_pending: int = 2,
+        max_delay: Optional[float] = None
+    ) -> AsyncIterator:
+    """ Parse values of an async (or regular) iterable by batches and yield the parsed values
+
+    Batches are parsed with the parser ``parse_many`` method. The source is not read
+    further while ``max_pending`` batches are waiting to be consumed, so a slow consumer
+    slows down the reading of the source.
+
+    Args:
+        parser: any parser object
+        values: an async iterable or a regular iterable
+        batch_size: maximum number of values parsed at once
+        executor (optional): a thread or process pool executor where batches are parsed.
+            If None batches are parsed in the event loop thread, the loop is released between
+            two batches.
+        max_pending: maximum number of batches submitted to the executor at the same time
+        max_delay (optional, float): maximum time (second) to wait for a batch to be filled,
+            after this delay an incomplete batch is parsed. None: batches are parsed when
+            full or at the end of the source.
+    """
+    if batch_size<1:
+        raise ValueError("batch_size must be strictly positive")
+    if max_pending<1:
+        raise ValueError("max_pending must be strictly positive")
+
+    batches = _iter_batches(_aiter(values), batch_size, max_delay)
+    try:
+        if executor is None:
+            async for batch in batches:
+                for value in parser.parse_many(batch):
+                    yield value
+                await asyncio.sleep(0)
+        else:
+            loop = asyncio.get_running_loop()
+            pending = deque()
+            try:
+                async for batch in batches:
+                    pending.append( loop.run_in_executor(executor, parser.parse_many, batch) )
+                    if len(pending) >= max_pending:
+                        for value in await pending.popleft():
+                            yield value
+                while pending:
+                    for value in await pending.popleft():
+                        yield value
+            finally:
+                for future in pending:
+                    future.cancel()
+    finally:
+        await batches.aclose()
+
+
+async def _aiter(values: Union[AsyncIterable, Iterable]) -> AsyncIterator:
+    if hasattr(values, "__aiter__"):
+        async for value in values:
+            yield value
+    else:
+        for value in values:
+            yield value
+
+
+async def _iter_batches(aiterator: AsyncIterator, batch_size: int, max_delay: Optional[float]) -> AsyncIterator:
+    """ Yield lists of values of maximum size batch_size """
+    if max_delay is None:
+        batch = []
+        async for value in aiterator:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    loop = asyncio.get_running_loop()
+    next_value = None
+    try:
+        while True:
+            batch = []
+            deadline = loop.time()+max_delay
+            while len(batch) < batch_size:
+                if next_value is None:
+                    next_value = asyncio.ensure_future( aiterator.__anext__() )
+                done, _ = await asyncio.wait( {next_value}, timeout=max(0.0, deadline-loop.time()))
+                if not done:
+                    break
+                future, next_value = next_value, None
+                try:
+                    batch.append( future.result() )
+                except StopAsyncIteration:
+                    if batch:
+                        yield batch
+                    return
+            if batch:
+                yield batch
+    finally:
+        if next_value is not None:
+            next_value.cancel()
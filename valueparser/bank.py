@@ -0,0 +1,300 @@
+""" Parse records of many channels, channels are grouped by parser class and parsed in batch
+
+Usage::
+
+    from valueparser import ParserBank, Clipped
+
+    bank = ParserBank({f"ch{i}": parser( (float, Clipped), min=-i, max=i) for i in range(5000)})
+    bank.parse( {"ch0": "0.5", "ch1": 2.0, ...} ) # {"ch0": 0.0, "ch1": 1.0, ...}
+    bank.parse( values ) # values in the order of channels
+    bank.parse_array( cycles ) # an array of shape (n, 5000) -> a structured array of shape (n,)
+
+The 5000 channels above are parsed by one call of the vectorized chain, the ``min`` and ``max``
+parameters are given to it as arrays with one value per channel.
+"""
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from .engine import (AbcParser, BaseParser, _array_dtypes, _freeze_config, _get_numpy,
+                     _values_key, parser)
+from .record import RecordError, _missing_error
+
+
+def _item_getter(indexes: list) -> Callable:
+    """ like itemgetter but always return a tuple """
+    if len(indexes) == 1:
+        index, = indexes
+        return lambda values: (values[index],)
+    return itemgetter(*indexes)
+
+
+def _is_vectorized(stage) -> bool:
+    if stage in _array_dtypes:
+        return True
+    if not (isinstance(stage, type) and issubclass(stage, BaseParser)):
+        return False
+    owner = next( cls for cls in stage.__mro__ if "__parse_array__" in cls.__dict__ )
+    return owner is not BaseParser
+
+
+def _array_fields(Parser: Type[BaseParser]) -> Optional[Tuple[str, ...]]:
+    """ Return the fields Parser accepts as arrays or None if Parser is not vectorized
+
+    A field is accepted as array if all the stages using it accept it.
+    """
+    stages = Parser.__get_stages__()
+    if not all( _is_vectorized(stage) for stage in stages ):
+        return None
+    fields = []
+    for name in Parser.Config.__fields__:
+        users = [stage for stage in stages if issubclass(stage, BaseParser) and name in stage.Config.__fields__]
+        if users and all( name in stage.__array_params__ for stage in users):
+            fields.append(name)
+    return tuple(fields)
+
+
+class _BatchGroup:
+    """ Channels with equal parsers parsed by one ``parse_many`` call """
+    kind = "batch"
+
+    def __init__(self, shared: AbcParser, names: list, indexes: list):
+        self.parser = shared
+        self.names = tuple(names)
+        self.indexes = indexes
+        self.get_values = _item_getter(indexes)
+
+    def parse_values(self, np, values: tuple) -> list:
+        return self.parser.parse_many( self.get_values(values) )
+
+    def parse_columns(self, np, columns):
+        # columns is an array of shape (..., number of channels)
+        return np.asarray( self.parser.parse_many(columns.reshape(-1).tolist()) ).reshape(columns.shape)
+
+    def describe(self) -> str:
+        return f"{len(self.names)} x {self.parser!r}, parse_many"
+
+
+class _VectorGroup:
+    """ Channels of the same parser class parsed by one ``__parse_array__`` call
+
+    Parameters differing between channels are given to the parser as arrays (one value per channel)
+    """
+    kind = "vector"
+
+    def __init__(self, Parser: Type[BaseParser], parsers: list, names: list, indexes: list, array_fields: tuple):
+        np = _get_numpy()
+        self.Parser = Parser
+        self.names = tuple(names)
+        self.indexes = indexes
+        self.get_values = _item_getter(indexes)
+
+        params = _freeze_config(parsers[0].__config__)
+        self.varying = []
+        for name in array_fields:
+            values = [getattr(p.__config__, name) for p in parsers]
+            if any( value != values[0] for value in values ):
+                object.__setattr__(params, name, np.asarray(values))
+                self.varying.append(name)
+        self.params = params
+
+    def parse_values(self, np, values: tuple) -> list:
+        return self.Parser.__parse_array__( np.asarray(self.get_values(values)), self.params).tolist()
+
+    def parse_columns(self, np, columns):
+        return self.Parser.__parse_array__(columns, self.params)
+
+    def describe(self) -> str:
+        varying = f" with per channel {', '.join(self.varying)}" if self.varying else ""
+        return f"{len(self.names)} x {self.Parser.__name__}, vectorized{varying}"
+
+
+def _make_groups(parsers: Dict[str, AbcParser], min_vector_size: int) -> list:
+    vector_candidates: Dict[Any, tuple] = {}
+    batches: Dict[Any, list] = {}
+    array_fields: Dict[type, Optional[tuple]] = {}
+
+    def add_to_batch(index, name, p):
+        try:
+            key = (p,) # parsers are compared by spec
+            batches.setdefault(key, []).append((index, name, p))
+        except TypeError: # not hashable
+            batches.setdefault(id(p), []).append((index, name, p))
+
+    for index, (name, p) in enumerate(parsers.items()):
+        fields = None
+        if isinstance(p, BaseParser):
+            Parser = type(p)
+            if Parser not in array_fields:
+                array_fields[Parser] = _array_fields(Parser)
+            fields = array_fields[Parser]
+        if fields is None:
+            add_to_batch(index, name, p)
+            continue
+        config = p.__config__
+        key = (Parser, _values_key(config, [f for f in config.__fields__ if f not in fields]))
+        try:
+            vector_candidates.setdefault(key, (fields, []))[1].append((index, name, p))
+        except TypeError:
+            add_to_batch(index, name, p)
+
+    groups: list = []
+    for (Parser, _), (fields, members) in vector_candidates.items():
+        if len(members) < min_vector_size:
+            for index, name, p in members:
+                add_to_batch(index, name, p)
+            continue
+        indexes, names, members_parsers = (list(items) for items in zip(*members))
+        groups.append( _VectorGroup(Parser, members_parsers, names, indexes, fields) )
+
+    for members in batches.values():
+        indexes, names, members_parsers = (list(items) for items in zip(*members))
+        groups.append( _BatchGroup(members_parsers[0], names, indexes) )
+    return groups
+
+
+class ParserBank(AbcParser):
+    """ Parse records of many named channels, each channel having its own parser
+
+    Channels are grouped and each group is parsed in one pass:
+
+    - channels of the same vectorized parser class (all stages with an array form) are parsed by one
+      call of its ``__parse_array__``. Configuration values differing between channels are given as arrays
+      when the stages accept it (see ``BaseParser.__array_params__``, e.g. ``min`` and ``max`` of Clipped),
+      channels with other differing values are in separate groups.
+    - other channels with equal parsers are parsed by one ``parse_many`` call.
+
+    Values of a vectorized group are converted by numpy, e.g. a group mixing int and float values
+    returns floats.
+
+    A record is a mapping of channel name -> value or a sequence of values in the order of channels.
+    All invalid or missing channels of a record are reported together in a :class:`RecordError`.
+
+    Args:
+        channels: dictionary of channel name -> anything accepted by :func:`parser`
+        min_vector_size: vectorized groups with less channels are parsed with ``parse_many``
+    """
+    def __init__(self, channels: Mapping[str, Any], min_vector_size: int = 8):
+        self._specs = dict(channels)
+        self.min_vector_size = min_vector_size
+        self.parsers = {name: parser(spec) for name, spec in self._specs.items()}
+        self.channels = tuple(self.parsers)
+        self.groups = _make_groups(self.parsers, min_vector_size)
+        self._get_channels = _item_getter(list(self.channels)) if self.channels else (lambda record: ())
+        self._dtypes: Dict[tuple, Any] = {}
+
+    def __reduce__(self):
+        return (ParserBank, (self._specs, self.min_vector_size))
+
+    def __len__(self):
+        return len(self.channels)
+
+    def explain(self) -> str:
+        """ Describe how channels are grouped """
+        lines = [f"ParserBank: {len(self.channels)} channels in {len(self.groups)} groups"]
+        lines.extend( f"  {group.describe()}" for group in self.groups )
+        return "\n".join(lines)
+
+    def _values(self, record: Any) -> tuple:
+        if isinstance(record, Mapping):
+            return self._get_channels(record)
+        if len(record) < len(self.channels):
+            raise IndexError("missing values")
+        return record.tolist() if hasattr(record, "tolist") else record
+
+    def parse(self, record: Any) -> dict:
+        """ Parse one record and return a dictionary of channel name -> parsed value """
+        np = _get_numpy()
+        try:
+            values = self._values(record)
+            parsed = dict.fromkeys(self.channels) # keep the order of channels
+            for group in self.groups:
+                parsed.update( zip(group.names, group.parse_values(np, values)) )
+            return parsed
+        except (ValueError, TypeError, KeyError, IndexError):
+            pass
+        # missing or invalid channels, parse channel per channel to find all the errors
+        parsed, errors = self._parse_per_channel(record)
+        if errors:
+            raise RecordError(errors)
+        return parsed
+
+    def _parse_per_channel(self, record: Any) -> tuple:
+        parsed, errors = {}, {}
+        is_mapping = isinstance(record, Mapping)
+        for i, (name, channel_parser) in enumerate(self.parsers.items()):
+            try:
+                value = record[name] if is_mapping else record[i]
+            except (KeyError, IndexError):
+                errors[name] = _missing_error(name)
+                continue
+            try:
+                parsed[name] = channel_parser.parse(value)
+            except (ValueError, TypeError) as err:
+                errors[name] = err
+        return parsed, errors
+
+    def parse_array(self, records):
+        """ Parse records and return a numpy structured array with one field per channel
+
+        Args:
+            records: an array like of shape (..., number of channels) with values in the order of channels
+                or a mapping of channel name -> values (all of the same shape)
+
+        Returns:
+            A structured array of shape records.shape[:-1] (or the shape of the mapping values)
+        """
+        np = _get_numpy()
+        if isinstance(records, Mapping):
+            missing = [name for name in self.channels if name not in records]
+            if missing:
+                raise RecordError( {name: _missing_error(name) for name in missing} )
+            values = np.stack( [np.asarray(records[name]) for name in self.channels], axis=-1)
+        else:
+            values = np.asarray(records)
+            if values.shape[-1:] != (len(self.channels),):
+                raise ValueError(f"expecting records of {len(self.channels)} values, got an array of shape {values.shape}")
+
+        results, errors = [], {}
+        for group in self.groups:
+            columns = values[..., group.indexes]
+            try:
+                results.append( group.parse_columns(np, columns) )
+            except (ValueError, TypeError):
+                results.append( self._parse_columns_per_channel(group, columns, errors) )
+        if errors:
+            raise RecordError(errors)
+        return self._to_structured(np, values.shape[:-1], results)
+
+    def _parse_columns_per_channel(self, group, columns, errors: dict):
+        np = _get_numpy()
+        parsed = []
+        for j, name in enumerate(group.names):
+            try:
+                parsed.append( self.parsers[name].parse_array(columns[..., j]) )
+            except (ValueError, TypeError) as err:
+                errors[name] = err
+        if len(parsed) < len(group.names):
+            return None
+        return np.stack(parsed, axis=-1)
+
+    def _to_structured(self, np, shape: tuple, results: List[Any]):
+        key = tuple( result.dtype for result in results )
+        dtype = self._dtypes.get(key, None)
+        if dtype is None:
+            field_dtypes = {}
+            for group, result in zip(self.groups, results):
+                field_dtypes.update( dict.fromkeys(group.names, result.dtype) )
+            dtype = self._dtypes[key] = np.dtype([ (name, field_dtypes[name]) for name in self.channels ])
+
+        if len(set(key)) == 1 and key[0] != object:
+            # all channels have the same type, results are gathered in one array seen as structured
+            gathered = np.empty( shape+(len(self.channels),), dtype=key[0])
+            for group, result in zip(self.groups, results):
+                gathered[..., group.indexes] = result
+            return gathered.view(dtype)[..., 0]
+
+        out = np.empty(shape, dtype=dtype)
+        for group, result in zip(self.groups, results):
+            for j, name in enumerate(group.names):
+                out[name] = result[..., j]
+        return out
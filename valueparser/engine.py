@@ -1,15 +1,42 @@
 from abc import ABC, abstractmethod, abstractproperty
 
 from abc import abstractmethod
-from typing import Any, Callable, Iterable, List, Type, TypeVar, Generic, Union
-from pydantic import BaseModel, Extra, ValidationError, root_validator
-from pydantic.fields import ModelField
+from collections import OrderedDict, namedtuple
+import sys
+import weakref
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Generic, Union
+from pydantic import BaseModel, Extra, ValidationError
+from pydantic.fields import ModelField, PrivateAttr
 
 from systemy import BaseSystem, BaseFactory, systemclass, register_factory, get_factory_class
 
+# numpy is only needed for the array parsing, it is imported on first use 
+# by _get_numpy to keep the import of valueparser fast 
+np = None 
+
 PARSER_NAMESPACE = "parser"
 PARSER_KIND = "Parser"
 
+def _get_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required to parse arrays") from None
+        np = numpy 
+    return np
+
+def _to_list(values) -> list:
+    """ return a list of python objects from an array or any iterable """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.tolist()
+    return list(values)
+
 class AbcParser(ABC):
     @abstractmethod
     def parse(self, value):
@@ -21,31 +48,547 @@ class AbcParser(ABC):
             - raise ValueError exception 
         """
     
-class BaseParser(BaseSystem):
+    def parse_many(self, values: Iterable) -> list:
+        """ parse all values of an iterable and return a list of parsed values """
+        parse = self.parse
+        return [parse(value) for value in values]
+    
+    def parse_array(self, values):
+        """ parse an array like object and return a numpy array """
+        np = _get_numpy()
+        return np.asarray(self.parse_many( _to_list(values) ))
+    
+    def try_parse(self, value: Any) -> Tuple[bool, Any]:
+        """ parse a value without raising error 
+
+        Return:
+            ok (bool): False if the value was rejected 
+            value_or_error: the parsed value or the error (a ValueError or a TypeError)
+        """
+        try:
+            return (True, self.parse(value))
+        except (ValueError, TypeError) as err:
+            return (False, err)
+
+    def compile(self) -> Callable[[Any], Any]:
+        """ return a function parsing one value """
+        return self.parse
+    
+    def parse_iter(self, values: Iterable, on_error: str = "raise", chunk_size: int = 1000, 
+                     default: Any = None, errors: Optional[list] = None) -> Iterator:
+        """ Lazily parse an iterable, see :func:`parse_iter` """
+        return parse_iter(self, values, on_error, chunk_size, default, errors)
+    
+    async def aparse(self, value: Any, executor: Optional[Executor] = None) -> Any:
+        """ Parse a value from a coroutine, see :func:`valueparser.aio.aparse` """
+        from .aio import aparse
+        return await aparse(self, value, executor)
+    
+    def aparse_iter(self, values: Union[AsyncIterable, Iterable], batch_size: int = 1000, 
+                      executor: Optional[Executor] = None, max_pending: int = 2, 
+                      max_delay: Optional[float] = None) -> AsyncIterator:
+        """ Parse values of an async iterable by batches, see :func:`valueparser.aio.aparse_iter` """
+        from .aio import aparse_iter
+        return aparse_iter(self, values, batch_size, executor, max_pending, max_delay)
+    
+    def parse_parallel(self, values: Iterable, workers: Optional[int] = None, chunk_size: int = 10000, 
+                         executor: Optional[Executor] = None) -> list:
+        """ Parse values in a pool of processes, see :func:`parse_parallel` """
+        return parse_parallel(self, values, workers, chunk_size, executor)
+    
+    def parse_file(self, path, dtype=None, chunk_size: int = 1_000_000, out=None, **kwargs):
+        """ Parse a memory-mapped file chunk by chunk, see :func:`valueparser.files.parse_file` """
+        from .files import parse_file
+        return parse_file(self, path, dtype, chunk_size, out, **kwargs)
+
+    def parse_into(self, values, out=None) -> tuple:
+        """ Parse a numerical buffer into a buffer without exception, see :func:`parse_into` """
+        return parse_into(self, values, out)
+
+class ParserParams:
+    """ Frozen snapshot of a parser configuration 
+
+    It is given to the ``__parse__`` methods in place of the configuration, 
+    its attributes are the configuration fields. Other attributes of the Config 
+    class (e.g. methods, properties or ``dict``) are forwarded to the configuration. 
+    """
+    __slots__ = ("__memo__", "__config__")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("parser parameters are frozen, change the parser configuration instead")
+    
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __repr__(self):
+        args = ", ".join( f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({args})"
+
+_params_classes = weakref.WeakKeyDictionary()
+
+def _get_params_class(Config: Type[BaseModel]) -> Type[ParserParams]:
+    try:
+        return _params_classes[Config]
+    except KeyError:
+        pass 
+    namespace = {"__slots__": tuple(Config.__fields__)}
+    # non-field attributes are forwarded to the configuration by descriptors, 
+    # a __getattr__ fallback would slow down the access to fields  
+    for name in dir(Config):
+        if name not in Config.__fields__ and not (name.startswith("__") and name.endswith("__")):
+            namespace[name] = _forwarded_attribute(name)
+    Params = type( Config.__name__.replace(".", "")+"Params", (ParserParams,), namespace)
+    _params_classes[Config] = Params
+    return Params
+
+def _forwarded_attribute(name: str) -> property:
+    def get(params):
+        return getattr(params.__config__, name)
+    return property(get)
+
+def _freeze_config(config: BaseModel) -> ParserParams:
+    Params = _get_params_class(type(config))
+    params = object.__new__(Params)
+    for name in Params.__slots__:
+        object.__setattr__(params, name, getattr(config, name))
+    object.__setattr__(params, "__memo__", {})
+    object.__setattr__(params, "__config__", config)
+    return params 
+
+def cached_on_params(params: ParserParams, func: Callable[[ParserParams], Any]) -> Any:
+    """ Return ``func(params)`` computed once per configuration snapshot 
+
+    This is intended to build, inside ``__parse__``, objects derived from 
+    the configuration (e.g. a lookup table). The result is rebuilt when the 
+    configuration is changed.
+    """
+    try:
+        memo = params.__memo__
+    except AttributeError: # not a frozen snapshot, nothing can be cached 
+        return func(params)
+    try:
+        return memo[func]
+    except KeyError:
+        result = memo[func] = func(params)
+        return result 
+
+_scalar_types = frozenset([int, float, complex, bool, str, bytes, type(None)])
+
+def _freeze_value(value: Any) -> Any:
+    # the type is part of the key: e.g. Default(default=True) is not Default(default=1) 
+    if type(value) in _scalar_types:
+        return (type(value), value)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple( _freeze_value(v) for v in value))
+    if isinstance(value, dict):
+        return (type(value), tuple( (k, _freeze_value(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset( _freeze_value(v) for v in value))
+    return (type(value), value)
+
+def _values_key(obj: Any, names: Iterable[str]) -> tuple:
+    return tuple([ (name, _freeze_value(getattr(obj, name))) for name in names ])
+
+def _params_key(params: ParserParams) -> tuple:
+    return _values_key(params, type(params).__slots__)
+
+class BaseParser(BaseSystem, AbcParser):
     class Config(BaseSystem.Config, extra="forbid"):
-        ...
+        __params__ = PrivateAttr(None)
+        __frozen__ = PrivateAttr(False) # True for the configuration of interned parsers 
+
+        def __setattr__(self, name, value):
+            if self.__frozen__:
+                raise AttributeError("the configuration of an interned parser cannot be changed, build a new parser instead")
+            super().__setattr__(name, value)
+            # any change invalidate the frozen parameters 
+            object.__setattr__(self, "__params__", None)
+        
+        def __getstate__(self):
+            state = super().__getstate__()
+            state["__private_attribute_values__"] = {**state["__private_attribute_values__"], "__params__": None, "__frozen__": False} 
+            return state 
+
+        def copy(self, **kwargs):
+            # a copy is never frozen and its parameters are rebuilt if values are updated 
+            config = super().copy(**kwargs)
+            object.__setattr__(config, "__frozen__", False)
+            if kwargs.get("update"):
+                object.__setattr__(config, "__params__", None)
+            return config 
+        
+        def __spec_key__(self) -> tuple:
+            """ Return a comparable (and hashable if the values are) form of the configuration values """
+            params = self.__params__
+            if params is None: # do not build a snapshot only for the key 
+                return _values_key(self, self.__fields__)
+            return cached_on_params(params, _params_key)
+
+        def __get_params__(self) -> ParserParams:
+            """ Return a frozen snapshot of the configuration 
+            
+            The snapshot is rebuilt after any configuration attribute assignment. 
+            Note: in place modification of a mutable value (e.g. a list) is not detected 
+            """
+            params = self.__params__
+            if params is None:
+                params = _freeze_config(self)
+                object.__setattr__(self, "__params__", params)
+            return params
+
+    __covers__: tuple = ()
+    """ Parser classes made redundant by this parser when they follow it in a chain (same configuration) """
+
+    __array_params__: tuple = ()
+    """ Configuration fields ``__parse_array__`` accepts as arrays broadcasted on values (see ParserBank) """
 
     @staticmethod        
     def __parse__(value:Any, config: Config):
         raise NotImplementedError("__parse__")
+    
+    @classmethod
+    def __get_stages__(cls) -> tuple:
+        return (cls,)
+
+    @classmethod
+    def __parse_many__(cls, values: Iterable, config: Config) -> list:
+        parse = cls.__parse__
+        return [parse(value, config) for value in values]
+    
+    @classmethod
+    def __try_parse__(cls, value: Any, config: Config) -> Tuple[bool, Any]:
+        try:
+            return (True, cls.__parse__(value, config))
+        except (ValueError, TypeError) as err:
+            return (False, err)
+    
+    @classmethod
+    def __parse_array__(cls, values, config: Config):
+        # No vectorized form, fallback to an element per element parsing 
+        return np.asarray(cls.__parse_many__(_to_list(values), config))
 
     def parse(self, value):
-        return self.__parse__(value, self.__config__)
+        config = self.__config__
+        return self.__parse__(value, config.__params__ or config.__get_params__())
+
+    def parse_many(self, values: Iterable) -> list:
+        """ parse all values of an iterable and return a list of parsed values 
+
+        The configuration is resolved once for the whole batch 
+        """
+        return self.__parse_many__(values, self.__config__.__get_params__())
+    
+    def try_parse(self, value: Any) -> Tuple[bool, Any]:
+        """ parse a value without raising error 
+
+        Return:
+            ok (bool): False if the value was rejected 
+            value_or_error: the parsed value or the error (a ValueError or a TypeError)
+        """
+        config = self.__config__
+        return self.__try_parse__(value, config.__params__ or config.__get_params__())
+    
+    def parse_array(self, values):
+        """ parse an array like object and return a numpy array 
+
+        The parser vectorized form (``__parse_array__``) is used if any 
+        """
+        np = _get_numpy()
+        return self.__parse_array__(np.asarray(values), self.__config__.__get_params__())
+    
+    def __reduce__(self):
+        return _reduce_parser(self)
+    
+    def __eq__(self, other):
+        # parsers are equal if they have the same class and the same configuration values 
+        if type(other) is not type(self):
+            return NotImplemented 
+        if self is other:
+            return True 
+        try:
+            return bool(self.__config__.__spec_key__() == other.__config__.__spec_key__())
+        except (ValueError, TypeError): # values without a boolean comparison (e.g. numpy arrays)
+            return False 
+    
+    def __hash__(self):
+        # The hash follows the configuration values: a parser used as a dictionary key 
+        # or in a set shall not be changed afterward (interned parsers cannot be changed). 
+        # Parsers with unhashable values share the hash of their class. 
+        try:
+            return hash( (type(self), self.__config__.__spec_key__()) )
+        except TypeError:
+            return hash(type(self))
+
+    def compile(self) -> Callable[[Any], Any]:
+        """ Compile the parser into one single python function parsing one value 
+
+        Builtin parsers with an ``__parse_source__`` method are inlined with their configuration 
+        values bound as constants. The configuration is frozen at compile time, the function 
+        shall be compiled again if the parser configuration is changed. 
+        """
+        return _compile_stages(self.__get_stages__(), self.__config__.__get_params__(), self.__class__.__name__)
+
+    def explain(self) -> str:
+        """ Describe the stages run by the parser and how its chain was rewritten """
+        params = self.__config__.__get_params__()
+        lines = [f"{type(self).__name__}: {' -> '.join(_stage_name(stage) for stage in self.__get_stages__())}"]
+        lines.extend( f"  {rewrite}" for rewrite in getattr(self, "__rewrites__", ()) )
+        builder = _SourceBuilder()
+        for stage in self.__get_stages__():
+            builder.add_stage(stage, params)
+        lines.extend( f"  {_stage_name(stage)} is a no-op with this configuration, skipped when compiled" 
+                      for stage in builder.skipped )
+        return "\n".join(lines)
+
+ON_ERROR_POLICIES = ("raise", "skip", "default", "collect")
+
+def parse_iter(
+        parser: AbcParser, 
+        values: Iterable, 
+        on_error: str = "raise", 
+        chunk_size: int = 1000, 
+        default: Any = None, 
+        errors: Optional[list] = None
+    ) -> Iterator:
+    """ Lazily parse values of an iterable and yield parsed values 
+    
+    Values are parsed by chunks with the parser ``parse_many`` method, a chunk is 
+    parsed value per value only if one of its value is rejected. 
+
+    Args:
+        parser: any parser object 
+        values: an iterable, e.g. a generator 
+        on_error: what to do when a value is rejected (raise a ValueError or a TypeError) 
+            - "raise": the error is raised 
+            - "skip": the value is skipped
+            - "default": the ``default`` value is yielded instead
+            - "collect": the value is skipped and recorded in ``errors``  
+        chunk_size: number of values parsed at once 
+        default: the value yielded for rejected values when on_error="default"
+        errors (list, optional): if given, ``(index, error_code, value)`` tuples of rejected 
+            values are appended to it. error_code is None if the error is not a ParseError.
+            Mandatory when on_error="collect" 
+    """
+    if on_error not in ON_ERROR_POLICIES:
+        raise ValueError(f"on_error must be one of {ON_ERROR_POLICIES} got {on_error!r}")
+    if on_error == "collect" and errors is None:
+        raise ValueError("an errors list must be given when on_error='collect'")
+    if chunk_size<1:
+        raise ValueError("chunk_size must be strictly positive")
+    return _iter_parse(parser, iter(values), on_error, chunk_size, default, errors)
+
+def _iter_chunks(values: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+def _iter_parse(parser, iterator, on_error, chunk_size, default, errors):
+    try_parse, parse_many = parser.try_parse, parser.parse_many
+    index = 0
+    for chunk in _iter_chunks(iterator, chunk_size):
+        if on_error == "raise":
+            try:
+                parsed = parse_many(chunk)
+            except (ValueError, TypeError):
+                # the values before the rejected one are yielded before the error is raised 
+                parse = parser.parse
+                parsed = (parse(value) for value in chunk)
+            yield from parsed
+        else:
+            try:
+                parsed = parse_many(chunk)
+            except (ValueError, TypeError):
+                parsed = _parse_chunk_per_value(try_parse, chunk, index, on_error, default, errors)
+            yield from parsed
+        index += len(chunk)
+
+def _parse_chunk_per_value(try_parse, chunk, index, on_error, default, errors):
+    parsed = []
+    for i, value in enumerate(chunk, index):
+        ok, result = try_parse(value)
+        if ok:
+            parsed.append( result )
+            continue
+        if errors is not None:
+            errors.append( (i, getattr(result, "error_code", None), value) )
+        if on_error == "default":
+            parsed.append( default )
+    return parsed 
+
+
+def parse_parallel(
+        parser: AbcParser, 
+        values: Iterable, 
+        workers: Optional[int] = None, 
+        chunk_size: int = 10000, 
+        executor: Optional[Executor] = None
+    ) -> list:
+    """ Parse values by chunks in a pool of processes and return the list of parsed values 
+
+    The parser is pickled and sent to the workers, all parsers built from 
+    importable objects (e.g. ``parser((float, Clipped), max=1)``) can be pickled.
+    
+    Args:
+        parser: any picklable parser object 
+        values: an iterable of values 
+        workers (optional, int): number of processes, default is the number of CPUs 
+        chunk_size: number of values sent at once to a worker 
+        executor (optional): an executor to use instead of creating a new pool of processes
+    """
+    if chunk_size<1:
+        raise ValueError("chunk_size must be strictly positive")
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as executor:
+            return _parse_chunks_in_executor(executor, parser, values, chunk_size)
+    return _parse_chunks_in_executor(executor, parser, values, chunk_size)
+
+def parse_into(parser: AbcParser, values, out=None) -> tuple:
+    """ Parse a buffer of numbers and write the result in place or in an output buffer 
+
+    values and out can be any object of the buffer protocol (array.array, memoryview, 
+    shared memory, numpy array, ...), they are used without copy. Rejected values do 
+    not raise an error, they are flagged in the returned mask (their result is undefined).
+    Only parsers made of stages with a ``__parse_into__`` method (e.g. Bounded, Clipped, 
+    Rounded, Modulo) and of float and int casts are supported. 
+
+    Args:
+        parser: the parser
+        values: buffer of numbers, a bytearray shall be cast to the right type first 
+            (e.g. ``memoryview(buffer).cast('d')``)
+        out (optional): output buffer of the same shape, results are cast to its type. 
+            If None values are parsed in place. 
+    
+    Returns:
+        out: numpy array sharing the memory of the output buffer 
+        rejected: numpy boolean array, True where the value was rejected 
+    """
+    np = _get_numpy()
+    stages = _into_stages_of(parser)
+    values = _buffer_array(np, values)
+    out = values if out is None else _buffer_array(np, out)
+    if not out.flags.writeable:
+        raise ValueError("output buffer is read-only")
+    rejected = np.zeros(values.shape, dtype=bool)
+    if not stages and out is not values:
+        np.copyto(out, values, casting="unsafe")
+    for func, params in stages:
+        mask = func(values, out, params)
+        if mask is not None:
+            rejected |= mask 
+        values = out # next stages work in place 
+    return out, rejected 
+
+def _buffer_array(np, buffer):
+    """ numpy array sharing the memory of an object of the buffer protocol """
+    if isinstance(buffer, np.ndarray):
+        return buffer
+    return np.asarray(memoryview(buffer))
+
+def _float_into(values, out, params):
+    np.copyto(out, values, casting="unsafe")
+
+def _int_into(values, out, params):
+    rejected = None 
+    if values.dtype.kind == "f":
+        rejected = ~np.isfinite(values)
+    elif values.dtype.kind == "c": # int() does not accept complex 
+        rejected = np.ones(values.shape, dtype=bool)
+    if out.dtype.kind in "iu":
+        # values not fitting in out are rejected instead of wrapping around 
+        overflow = _int_overflow(values, np.iinfo(out.dtype))
+        if overflow is not None:
+            rejected = overflow if rejected is None else rejected | overflow 
+    with np.errstate(invalid="ignore"):
+        if out.dtype.kind in "fc":
+            np.trunc(values.real, out=out)
+        else:
+            np.copyto(out, values.real, casting="unsafe") # truncated toward zero like int()
+    return rejected 
+
+def _int_overflow(values, info):
+    """ Mask of the values whose integer part is outside the range of info (np.iinfo) """
+    if values.dtype.kind == "f":
+        with np.errstate(invalid="ignore"):
+            truncated = np.trunc(values)
+            return ~( (truncated >= float(info.min)) & (truncated < float(info.max)+1) )
+    if values.dtype.kind in "iu" and not np.can_cast(values.dtype, info.dtype):
+        return (values < info.min) | (values > info.max)
+    return None 
+
+_into_casts = {float: _float_into, int: _int_into}
+
+def _into_stages_of(parser) -> list:
+    if isinstance(parser, BaseParser):
+        return _into_stages(parser.__get_stages__(), parser.__config__.__get_params__())
+    if isinstance(parser, _CallableParser):
+        return _into_stages([parser._func], None)
+    if isinstance(parser, _WrapedCallableParser):
+        return _into_stages([parser.parse], None)
+    raise TypeError(f"{type(parser).__name__} does not support parse_into")
+
+def _into_stages(stages, params) -> list:
+    """ Return the list of (__parse_into__ function, params) of a chain of stages """
+    result = []
+    for stage in stages:
+        if isinstance(stage, type) and stage in _into_casts:
+            result.append( (_into_casts[stage], params) )
+        elif isinstance(stage, type) and hasattr(stage, "__parse_into__"):
+            result.append( (stage.__parse_into__, params) )
+        elif isinstance(stage, type) and issubclass(stage, _WrapedCallableParser):
+            result.extend( _into_stages([stage.parse], params) )
+        elif isinstance(stage, AbcParser) and not isinstance(stage, type): # an instance, with its own configuration
+            result.extend( _into_stages_of(stage) )
+        else:
+            raise TypeError(f"{_stage_name(stage)} does not support parse_into")
+    return result
+
+def _parse_chunks_in_executor(executor, parser, values, chunk_size):
+    parsed = []
+    for chunk in executor.map(parser.parse_many, _iter_chunks(values, chunk_size)):
+        parsed.extend(chunk)
+    return parsed 
 
 # # ## ## ## ## ## ## ## ## # ## ## ## ## ## ### ## ## ## ## ## ## ## ## # ## ## ###
 ParserVar = TypeVar('ParserVar')
 
 class ParserFactory(BaseFactory, Generic[ParserVar]):
-    type: Union[str,Callable, Type[AbcParser],List[Union[str,Callable,Type[AbcParser]]]]
+    type: Union[List[Union[str,Callable,Type[AbcParser]]],str,Callable, Type[AbcParser]]
     class Config:
         extra = "allow"
     
+    __validated__ = PrivateAttr(None) # (Parser class, validated configuration) reused by build 
+
     def __init__(self, type, **kwargs):
         if isinstance(type, dict):
             kwargs = {**type, **kwargs}
             type = kwargs.pop("type")
         super().__init__(type=type, **kwargs)
+        # check the parser arguments, the validated configuration is kept for build 
+        object.__setattr__(self, "__validated__", _validate_parser_args(self.type, kwargs))
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name not in self.__private_attributes__:
+            object.__setattr__(self, "__validated__", None)
+    
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {**state["__private_attribute_values__"], "__validated__": None} 
+        return state 
     
+    def copy(self, **kwargs):
+        factory = super().copy(**kwargs)
+        if kwargs.get("update"): # the validated configuration is outdated 
+            object.__setattr__(factory, "__validated__", None)
+        return factory 
+
     @classmethod
     def parse_obj(cls, obj):
         if not isinstance(obj, dict):
@@ -53,15 +596,13 @@ class ParserFactory(BaseFactory, Generic[ParserVar]):
         return super().parse_obj(obj)
 
     def build(self, parent=None, name=None):
-        return parser( self.type, **self.dict( exclude=set(['type'])) ) 
-    
-    @root_validator
-    def _check_args_validator(cls, values):
-        kws = values.copy()
-        type_ = kws.pop("type", None)
-        if type_:
-            parser( type_, **kws)
-        return values 
+        validated = self.__validated__
+        if validated is None:
+            return parser( self.type, **self.dict( exclude=set(['type'])) ) 
+        Parser, config = validated 
+        if parser_pool.enabled and issubclass(Parser, BaseParser):
+            return parser_pool._get_or_add(Parser, config, lambda: Parser( __config__=config.copy() ))
+        return Parser( __config__=config.copy() )
     
     @classmethod
     def __get_validators__(cls):
@@ -89,17 +630,74 @@ class ParserFactory(BaseFactory, Generic[ParserVar]):
 
 
 
+def _validate_parser_args(spec, kwargs: dict) -> Optional[tuple]:
+    """ Check the arguments of a parser spec as :func:`parser` does 
+
+    Return (Parser class, validated configuration) or None if the parser is not 
+    configurable (e.g. a callable)
+    """
+    if isinstance(spec, type) and hasattr(spec, "parse"):
+        Parser = spec 
+    elif not hasattr(spec, "__call__") and not hasattr(spec, "parse") and hasattr(spec, "__iter__"):
+        Parser = parser_class(spec) # cached 
+    else:
+        parser(spec, **kwargs)
+        return None 
+    if not issubclass(Parser, BaseSystem) or ("cache" in kwargs and "cache" not in Parser.Config.__fields__):
+        # e.g. the parser is wrapped in a Cached parser by parser() 
+        parser(spec, **kwargs)
+        return None 
+    return Parser, Parser.Config(**kwargs)
+
 class _CombinedParser(BaseParser):
     """ Auto built parser class from several parser classes """
     @classmethod
     def __get_parsers__(cls):
         return tuple()
     
+    @classmethod
+    def __get_stages__(cls):
+        return tuple()
+    
+    @classmethod
+    def __get_many_parsers__(cls):
+        return tuple()
+    
+    @classmethod
+    def __get_array_parsers__(cls):
+        return tuple()
+    
+    @classmethod
+    def __get_try_parsers__(cls):
+        return tuple()
+    
     @classmethod
     def __parse__(cls, value, config):
         for f in cls.__get_parsers__():
             value = f(value, config)
         return value 
+    
+    @classmethod
+    def __parse_many__(cls, values, config):
+        # each stage is applied to the whole batch before the next one 
+        values = list(values)
+        for f in cls.__get_many_parsers__():
+            values = f(values, config)
+        return values 
+    
+    @classmethod
+    def __parse_array__(cls, values, config):
+        for f in cls.__get_array_parsers__():
+            values = f(values, config)
+        return values
+    
+    @classmethod
+    def __try_parse__(cls, value, config):
+        for f in cls.__get_try_parsers__():
+            ok, value = f(value, config)
+            if not ok:
+                return (False, value)
+        return (True, value)
 
 class _CallableParser(AbcParser):
     def __init__(self, func: Callable):
@@ -107,10 +705,30 @@ class _CallableParser(AbcParser):
         self.__config__ = BaseParser.Config()
     def parse(self, value):
         return self._func(value)
+    def __reduce__(self):
+        return (_CallableParser, (self._func,))
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._func == other._func
+    def __hash__(self):
+        return hash( (_CallableParser, self._func) )
+    def parse_many(self, values):
+        return list(map(self._func, values))
+    def parse_array(self, values):
+        np = _get_numpy()
+        return _callable_to_fparse_array(self._func)(np.asarray(values), None)
 
 class _WrapedCallableParser(BaseSystem, AbcParser):
     def parse(self, value):
         raise NotImplementedError('parse')
+    def __reduce__(self):
+        return _reduce_parser(self)
+    def parse_many(self, values):
+        return list(map(self.parse, values))
+    def parse_array(self, values):
+        np = _get_numpy()
+        return _callable_to_fparse_array(self.parse)(np.asarray(values), None)
 
 
 
@@ -123,6 +741,139 @@ def _callable_to_fparse(func):
         return func(value)
     return __parse__
 
+def _callable_to_fparse_many(func):
+    """ convert a callable function with one argument to __parse_many__ compatible argument """
+    def __parse_many__(values, _):
+        return list(map(func, values))
+    return __parse_many__
+
+def _callable_to_ftry_parse(func):
+    """ convert a callable function with one argument to __try_parse__ compatible argument """
+    def __try_parse__(value, _):
+        try:
+            return (True, func(value))
+        except (ValueError, TypeError) as err:
+            return (False, err)
+    return __try_parse__
+
+def _fparse_to_ftry_parse(fparse):
+    """ convert a __parse__ function to a __try_parse__ compatible function """
+    def __try_parse__(value, config):
+        try:
+            return (True, fparse(value, config))
+        except (ValueError, TypeError) as err:
+            return (False, err)
+    return __try_parse__
+
+def _fparse_to_fparse_many(fparse):
+    """ convert a __parse__ function to a __parse_many__ compatible function """
+    def __parse_many__(values, config):
+        return [fparse(value, config) for value in values]
+    return __parse_many__
+
+_array_dtypes = {int: "int64", float: "float64", complex: "complex128"}
+
+def _in_int64_range(values) -> bool:
+    """ True if all values of a float array can be converted to int64 """
+    return bool( ((values >= -2.0**63) & (values < 2.0**63)).all() )
+
+def _exact_ints(values, func=int):
+    """ Convert a float array out of the int64 range to an object array of python integers """
+    np = _get_numpy()
+    return np.array( [func(value) for value in values.reshape(-1).tolist()], dtype=object).reshape(values.shape)
+
+def _astype_parse_array(dtype):
+    def __parse_array__(values, _):
+        if dtype == "int64" and values.dtype.kind in "fc":
+            if not np.isfinite(values).all():
+                raise ValueError("cannot convert a non finite value to integer")
+            if values.dtype.kind == "f" and not _in_int64_range(values):
+                return _exact_ints(values) # as int()
+        return values.astype(dtype)
+    return __parse_array__
+
+def _callable_to_fparse_array(func):
+    """ convert a callable function with one argument to __parse_array__ compatible argument 
+
+    Python numerical types are vectorized, other callables are applied element per element
+    """
+    try:
+        return _astype_parse_array( _array_dtypes[func] )
+    except (KeyError, TypeError):
+        pass
+    def __parse_array__(values, _):
+        return np.asarray( list(map(func, _to_list(values))) )
+    return __parse_array__
+
+def _fparse_to_fparse_array(fparse):
+    """ convert a __parse__ function to a __parse_array__ compatible function """
+    def __parse_array__(values, config):
+        return np.asarray( [fparse(value, config) for value in _to_list(values)] )
+    return __parse_array__
+
+class _SourceBuilder:
+    """ collect the source lines and constants of a compiled parser function """
+    def __init__(self):
+        self.lines = []
+        self.namespace = {}
+        self.skipped = [] # no-op stages not compiled 
+        self.numeric = False # True if the value is a real number at this point 
+    
+    def const(self, obj) -> str:
+        """ bind an object as a constant of the compiled function and return its name """
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+    
+    def add_stage(self, obj, config):
+        # a no-op stage still rejects values of other types (e.g. Bounded raises a TypeError 
+        # for a string), it is skipped only when the value is a real number 
+        if self.numeric and _is_noop(obj, config):
+            self.skipped.append(obj)
+            return 
+        self.numeric = obj in _numeric_casts 
+        if isinstance(obj, type):
+            if issubclass(obj, _CombinedParser):
+                for stage in obj.__get_stages__():
+                    self.add_stage(stage, config)
+            elif hasattr(obj, "__parse_source__"):
+                self.lines.extend( obj.__parse_source__(config, self.const) )
+            elif hasattr(obj, "__parse__"):
+                self.lines.append( f"value = {self.const(obj.__parse__)}(value, {self.const(config)})" )
+            elif hasattr(obj, "parse"):
+                self.lines.append( f"value = {self.const(obj.parse)}(value)" )
+            elif hasattr(obj, "__call__"):
+                self.lines.append( f"value = {self.const(obj)}(value)" )
+        else:
+            self.lines.append( f"value = {self.const(obj.parse)}(value)" )
+
+    def build(self, name: str) -> Callable[[Any], Any]:
+        body = "\n".join( "    "+line for line in self.lines+["return value"])
+        source = f"def {name}(value):\n{body}\n"
+        exec(compile(source, f"<compiled parser {name}>", "exec"), self.namespace)
+        func = self.namespace[name]
+        func.__source__ = source
+        return func
+
+_numeric_casts = (float, int)
+
+def _is_noop(obj, config) -> bool:
+    """ True if the stage leaves real numbers unchanged with this configuration (see ``__is_noop__``) """
+    is_noop = getattr(obj, "__is_noop__", None)
+    if is_noop is None:
+        return False
+    if not isinstance(obj, type): # an instance has its own configuration 
+        config = obj.__config__.__get_params__()
+    return is_noop(config)
+
+def _compile_stages(stages, config, name: str) -> Callable[[Any], Any]:
+    """ Build one python function from a list of parser stages """
+    builder = _SourceBuilder()
+    for stage in stages:
+        builder.add_stage(stage, config)
+    name = "".join( c if c.isalnum() else "_" for c in name)
+    return builder.build( f"compiled_{name}" )
+
 _parser_counter = int(0)
 def _auto_name(obj):
     global _parser_counter
@@ -142,33 +893,138 @@ def _combine_config_class(lst: list, name) -> Type:
                 Config = obj.Config
             except AttributeError:
                 continue
-            subclasses.append( Config)
+            if Config not in subclasses: # e.g. (Clipped, Rounded, Clipped)
+                subclasses.append( Config)
     subclasses = subclasses or [_CombinedParser.Config]
     return type(name+"Config", tuple(subclasses), {})
 
+def _stage_functions(obj) -> tuple:
+    """ return the (__parse__, __parse_many__, __parse_array__, __try_parse__) compatible functions of one stage 
+    
+    Return None if the object has no parse capability 
+    """
+    if isinstance(obj, type):
+        if hasattr(obj, "__parse__"):
+            return (
+                obj.__parse__, 
+                getattr(obj, "__parse_many__", None) or _fparse_to_fparse_many(obj.__parse__), 
+                getattr(obj, "__parse_array__", None) or _fparse_to_fparse_array(obj.__parse__), 
+                getattr(obj, "__try_parse__", None) or _fparse_to_ftry_parse(obj.__parse__), 
+            )
+        elif hasattr(obj, "parse"):
+            func = obj.parse
+        elif hasattr(obj, "__call__"):
+            func = obj
+        else:
+            return None
+    elif hasattr(obj, "parse"):
+        func = obj.parse
+    else:
+        raise ValueError(f"bad argument for parser_class {obj!r}")
+    return (
+        _callable_to_fparse(func), 
+        _callable_to_fparse_many(func), 
+        _callable_to_fparse_array(func), 
+        _callable_to_ftry_parse(func)
+    )
+
+_idempotent_types = frozenset([int, float, complex, bool, str, tuple, frozenset])
+
+def _stage_name(stage) -> str:
+    if isinstance(stage, type):
+        return stage.__name__
+    name = getattr(stage, "__name__", None)
+    if name is None:
+        return type(stage).__name__
+    return name
+
+def _is_redundant(previous, obj) -> bool:
+    """ True if stage obj leaves unchanged any value returned by the stage previous """
+    if isinstance(obj, type):
+        if obj is previous and obj in _idempotent_types: # e.g. float, float 
+            return True
+        # both classes use the configuration of the combined parser 
+        return isinstance(previous, type) and obj in getattr(previous, "__covers__", ())
+    if obj is previous: # same instance, same configuration
+        return type(obj) in getattr(obj, "__covers__", ())
+    return False
+
+def _optimize_stages(stages: Iterable) -> Tuple[list, list]:
+    """ Rewrite a chain of stages into an equivalent shorter one 
+
+    - the stages of combined parser classes are expanded (they share the configuration) and 
+      the parser classes wrapping a python type (e.g. Float) are replaced by the type 
+    - a stage made redundant by the previous one is removed: repeated python casts 
+      (e.g. float, float) or parser classes in the ``__covers__`` of the previous stage 
+      (e.g. Bounded after Clipped)
+
+    Return the new stages and the description of each rewrite 
+    """
+    optimized, rewrites = [], []
+    for obj in stages:
+        if isinstance(obj, type) and issubclass(obj, _CombinedParser):
+            expanded = obj.__get_stages__() # already optimized 
+        elif isinstance(obj, type) and issubclass(obj, _WrapedCallableParser) and isinstance(obj.parse, type):
+            expanded = [obj.parse] # e.g. Float -> float 
+        else:
+            expanded = [obj]
+        for stage in expanded:
+            if optimized and _is_redundant(optimized[-1], stage):
+                rewrites.append( f"{_stage_name(stage)} removed, redundant after {_stage_name(optimized[-1])}" )
+            else:
+                optimized.append(stage)
+    return optimized, rewrites
+
 def _parser_class_from_list( lst, name):
     fparses = []
+    fparses_many = []
+    fparses_array = []
+    fparses_try = []
+    stages = []
+    resolved = []
     for obj in lst:
         if isinstance(obj, str):
             Factory = get_parser_factory_class(obj)
             obj = Factory.get_system_class()
-
-        if isinstance(obj, type):
-            if hasattr(obj, "__parse__"):
-                fparses.append( obj.__parse__)
-            elif hasattr(obj, "parse"):
-                fparses.append( _callable_to_fparse(obj.parse) )
-            elif hasattr(obj, "__call__"):
-                fparses.append( _callable_to_fparse(obj) )
-        elif hasattr(obj, "parse"):
-            fparses.append( _callable_to_fparse(obj.parse) )   
-        else:
-            raise ValueError(f"bad argument for parser_class {obj!r}")
+        resolved.append(obj)
+    optimized, rewrites = _optimize_stages(resolved)
+
+    for obj in optimized:
+        functions = _stage_functions(obj)
+        if functions is None:
+            continue
+        fparse, fparse_many, fparse_array, fparse_try = functions 
+        fparses.append( fparse )
+        fparses_many.append( fparse_many )
+        fparses_array.append( fparse_array )
+        fparses_try.append( fparse_try )
+        stages.append( obj )
+
+    stages = tuple(stages)
     fparses = tuple(fparses)
+    fparses_many = tuple(fparses_many)
+    fparses_array = tuple(fparses_array)
+    fparses_try = tuple(fparses_try)
+    def __get_stages__(cls):
+        return stages
     def __get_parsers__(cls):
         return fparses
+    def __get_many_parsers__(cls):
+        return fparses_many
+    def __get_array_parsers__(cls):
+        return fparses_array
+    def __get_try_parsers__(cls):
+        return fparses_try
     Config = _combine_config_class(lst, name)
-    return systemclass(type( name, (_CombinedParser, ), {"__get_parsers__":classmethod(__get_parsers__), "Config":Config}))
+    return systemclass(type( name, (_CombinedParser, ), {
+                "__get_stages__":classmethod(__get_stages__), 
+                "__get_parsers__":classmethod(__get_parsers__), 
+                "__get_many_parsers__":classmethod(__get_many_parsers__), 
+                "__get_array_parsers__":classmethod(__get_array_parsers__), 
+                "__get_try_parsers__":classmethod(__get_try_parsers__), 
+                "__rewrites__": tuple(rewrites), 
+                "Config":Config
+            }))
         
 
 
@@ -218,8 +1074,165 @@ def register_parser_factory(name, cls=None) -> None:
     return register_factory(name, cls, kind=PARSER_KIND)
 
 def get_parser_factory_class(name) -> BaseFactory:
+    try:
+        return get_factory_class(name, kind=PARSER_KIND)
+    except ValueError:
+        # builtin parsers are registered when valueparser.parsers is imported, 
+        # the parsers of python types (e.g. "int") when they are first needed
+        from . import parsers 
+        parsers._load_builtin_parser(name)
     return get_factory_class(name, kind=PARSER_KIND)
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+class ParserClassCache:
+    """ A bounded LRU cache of parser classes built by :func:`parser_class` 
+
+    Classes are stored by their normalized spec (string names are resolved to 
+    the registered parser class). A maxsize of 0 disable the cache, None make it unbounded. 
+    """
+    def __init__(self, maxsize: Optional[int] = 256):
+        self._classes = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+    
+    def get(self, key) -> Optional[Type[AbcParser]]:
+        try:
+            Parser = self._classes[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._classes.move_to_end(key)
+        self.hits += 1
+        return Parser
+    
+    def set(self, key, Parser: Type[AbcParser]) -> None:
+        if self._maxsize == 0:
+            return 
+        self._classes[key] = Parser
+        self._classes.move_to_end(key)
+        self._trim()
+    
+    def resize(self, maxsize: Optional[int]) -> None:
+        """ Change the maximum number of classes kept in the cache """
+        self._maxsize = maxsize
+        self._trim()
+
+    def clear(self) -> None:
+        """ Remove all classes from the cache and reset statistics """
+        self._classes.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._classes))
+    
+    def __len__(self):
+        return len(self._classes)
+    
+    def __iter__(self):
+        return iter(list(self._classes.items()))
+    
+    def _trim(self):
+        if self._maxsize is None:
+            return 
+        while len(self._classes) > self._maxsize:
+            self._classes.popitem(last=False)
+
+parser_class_cache = ParserClassCache()
+
+PoolInfo = namedtuple("PoolInfo", ["hits", "misses", "currsize"])
+
+class ParserPool:
+    """ Flyweight pool of parser instances 
+
+    When the pool is enabled, :func:`parser`, the factories of :func:`parser_factory` and 
+    :meth:`ParserFactory.build` return one shared instance per (parser class, configuration values). 
+    The configuration of a shared parser is frozen, assigning one of its attributes raises an 
+    AttributeError. Parsers with a non hashable configuration value are not shared. 
+
+    The pool holds weak references, parsers no longer used are removed from the pool. 
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._parsers = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+    
+    def intern(self, parser: AbcParser) -> AbcParser:
+        """ Return the shared parser equal to parser, parser is frozen and added to the pool if none """
+        if not isinstance(parser, BaseParser):
+            return parser 
+        return self._get_or_add(type(parser), parser.__config__, lambda: parser)
+    
+    def _get_or_add(self, Parser: Type[BaseParser], config: BaseModel, new: Callable[[], BaseParser]) -> BaseParser:
+        key = (Parser, config.__spec_key__())
+        try:
+            shared = self._parsers.get(key)
+        except TypeError: # a configuration value is not hashable 
+            return new()
+        if shared is not None:
+            self.hits += 1
+            return shared 
+        self.misses += 1
+        shared = new()
+        object.__setattr__(shared.__config__, "__frozen__", True)
+        # setdefault: another thread may have added the same parser meanwhile 
+        return self._parsers.setdefault(key, shared)
+
+    @contextmanager
+    def interning(self, enabled: bool = True) -> Iterator["ParserPool"]:
+        """ Enable (or disable) the pool inside the context """
+        previous, self.enabled = self.enabled, enabled 
+        try:
+            yield self 
+        finally:
+            self.enabled = previous 
+    
+    def clear(self) -> None:
+        """ Remove all parsers from the pool (they stay frozen) and reset statistics """
+        self._parsers.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self) -> PoolInfo:
+        return PoolInfo(self.hits, self.misses, len(self._parsers))
+
+    def __len__(self):
+        return len(self._parsers)
+
+parser_pool = ParserPool()
+
+def _resolve_parser_name(obj):
+    if isinstance(obj, str):
+        return get_parser_factory_class(obj).get_system_class()
+    return obj 
+
+def _stage_key(obj):
+    # parser instances are compared by value, but the class built from a spec is bound
+    # to the instances of the spec: they are keyed by identity. The cached class keeps 
+    # the instances alive, their id cannot be reused. 
+    if isinstance(obj, AbcParser):
+        return (AbcParser, id(obj))
+    return _resolve_parser_name(obj)
+
+def _spec_key(obj):
+    """ Return a hashable key from a parser spec or None if the spec is not hashable """
+    if isinstance(obj, tuple):
+        key = (tuple, tuple( _stage_key(o) for o in obj))
+    else:
+        key = _stage_key(obj)
+    try:
+        hash(key)
+    except TypeError:
+        return None 
+    return key 
+
 def parser_class(
             obj: Union[Callable, Type[AbcParser], str, Iterable[Union[Callable, Type[AbcParser], str]] ], 
             name: str = None
@@ -233,6 +1246,9 @@ def parser_class(
             - a :class:`BaseParser` (which is returned as is if name is None)  
             - an iterable of a mix of above object kind
         name (str, optional): is the new class name. If not given one is created.  
+    
+    Classes built without name are cached by spec (see :data:`parser_class_cache`), 
+    the same class is returned for identical specs. 
     """
     if isinstance(obj, str):
         Factory = get_parser_factory_class(obj)
@@ -241,12 +1257,34 @@ def parser_class(
     if isinstance( obj, type) and hasattr(obj, "parse"):
         if name is None:
             return obj 
-        return type( name, (obj,),  {})
+        return _new_parser_class(obj, name)
+    
+    if not hasattr(obj, "__call__") and not hasattr(obj, "parse") and hasattr(obj, "__iter__"):
+        obj = tuple(obj)
 
-    if name is None:
-        name = _auto_name(obj)
+    if name is not None:
+        return _new_parser_class(obj, name)
     
+    key = _spec_key(obj)
+    if key is None:
+        return _new_parser_class(obj, None)
     
+    Parser = parser_class_cache.get(key)
+    if Parser is None:
+        Parser = _new_parser_class(obj, None)
+        parser_class_cache.set(key, Parser)
+    return Parser
+
+def _new_parser_class(obj, name: Optional[str]) -> Type[AbcParser]:
+    Parser = _build_parser_class(obj, name or _auto_name(obj))
+    # the spec allows to rebuild the class, e.g. when unpickling a parser
+    Parser.__parser_spec__ = (obj, name)
+    return Parser
+
+def _build_parser_class(obj, name: str) -> Type[AbcParser]:
+    if isinstance( obj, type) and hasattr(obj, "parse"):
+        return type( name, (obj,),  {})
+
     if hasattr(obj, "__call__"):
         return (type(name , (_WrapedCallableParser, ), {"parse": staticmethod(obj)}))
 
@@ -260,9 +1298,42 @@ def parser_class(
     raise ValueError("Bad Argument for parser_class")
 
 
+def _class_from_spec(obj, name: Optional[str]) -> Type[AbcParser]:
+    """ Return a parser class from its spec, named classes are also cached """
+    if name is None:
+        return parser_class(obj)
+    key = _spec_key(obj)
+    if key is None:
+        return parser_class(obj, name)
+    key = (key, name)
+    Parser = parser_class_cache.get(key)
+    if Parser is None:
+        Parser = parser_class(obj, name)
+        parser_class_cache.set(key, Parser)
+    return Parser
+
+def _is_importable(cls: type) -> bool:
+    module = sys.modules.get(cls.__module__, None)
+    return getattr(module, cls.__qualname__, None) is cls
+
+def _reduce_parser(parser: BaseSystem) -> tuple:
+    """ __reduce__ of parser systems, parser classes built at runtime are rebuilt from their spec """
+    Parser = type(parser)
+    spec = None if _is_importable(Parser) else Parser.__dict__.get("__parser_spec__", None)
+    config = parser.__config__
+    kwargs = {name: getattr(config, name) for name in config.__fields__}
+    return (_rebuild_parser, (None if spec else Parser, spec, kwargs, parser.__path__))
+
+def _rebuild_parser(Parser, spec, kwargs, path):
+    if spec is not None:
+        Parser = _class_from_spec(*spec)
+    return Parser( __config__=Parser.Config(**kwargs), __path__=path)
+
 def parser_factory_class(obj, name=None):
     Parser = parser_class(obj, name)
     def build(self, parent=None, name=""):
+        if parser_pool.enabled and issubclass(Parser, BaseParser):
+            return parser_pool._get_or_add(Parser, self, lambda: Parser( __config__=self.copy()))
         path = self._make_new_path(parent, name)
         return Parser( __config__= self, __path__=path)
     return type( Parser.__name__+"Factory", (Parser.Config,), {"build": build})
@@ -270,17 +1341,45 @@ def parser_factory_class(obj, name=None):
 def parser_factory(obj, **kwargs):
     return parser_factory_class(obj)(**kwargs)
 
-def parser(obj, **kwargs):
+def _config_fields(obj) -> dict:
+    """ Return the configuration fields of the parser built from obj """
+    if isinstance(obj, str) or (not hasattr(obj, "__call__") and not hasattr(obj, "parse") and hasattr(obj, "__iter__")):
+        obj = parser_class(obj) # cached 
+    Config = getattr(obj, "Config", None) if isinstance(obj, type) else None
+    return getattr(Config, "__fields__", {})
+
+def parser(obj, cache: Union[bool, int, dict, None] = None, **kwargs):
+    """ Build a parser from a parser class, a callable or a list of those 
+
+    If cache is given, the parser is wrapped in a :class:`valueparser.parsers.Cached` 
+    parser. cache is True (default cache), the maximum number of cached values or 
+    a dictionary of Cached options. If the parser configuration has itself a ``cache`` 
+    field, cache is given to the parser configuration. 
+    """
+    if cache is not None:
+        if "cache" in _config_fields(obj):
+            kwargs["cache"] = cache 
+        elif not cache:
+            return parser(obj, **kwargs)
+        else:
+            from .parsers import Cached
+            if cache is True:
+                options = {}
+            elif isinstance(cache, dict):
+                options = cache 
+            else:
+                options = {'maxsize':cache}
+            return Cached( parser=parser(obj, **kwargs), **options)
+
     if isinstance(obj, type) and hasattr(obj, "parse"):
-        return obj(**kwargs)
+        return _new_parser(obj, kwargs)
 
     if hasattr(obj, "__call__"):
         if kwargs:
             raise ValueError("parser from a callable does not accept kwargs")
         return _CallableParser(obj)
     if hasattr(obj, "__iter__"):
-        Parser = parser_class( obj)
-        return Parser( **kwargs)
+        return _new_parser(parser_class(obj), kwargs)
     if hasattr(obj, "parse"):
         if kwargs:
             raise ValueError("parser from a Parser Class does not accept kwargs")
@@ -292,6 +1391,13 @@ def parser(obj, **kwargs):
 
 #
 
+def _new_parser(Parser: Type[AbcParser], kwargs: dict) -> AbcParser:
+    if parser_pool.enabled and issubclass(Parser, BaseParser):
+        # the pool is looked up before the parser is created 
+        config = Parser.Config(**kwargs)
+        return parser_pool._get_or_add(Parser, config, lambda: Parser( __config__=config))
+    return Parser(**kwargs)
+
 ParserVar = TypeVar('ParserVar')
 class _ParserTyping(Generic[ParserVar]):
     @classmethod
@@ -308,27 +1414,15 @@ class _ParserTyping(Generic[ParserVar]):
 
     @classmethod
     def validate(cls, v, field: ModelField):
+        if not field.sub_fields:
+            return cls.__parse__(v)
         
-        errors = []
-
-        if field.sub_fields:
-            if len(field.sub_fields)>1:
-                raise ValidationError(['to many field conparser() built type require and accept only one argument'], cls)
-            val_f = field.sub_fields[0]
-                       
-            valid_value, error = val_f.validate(v, {}, loc='value')
-            
-            if error:    
-                errors.append(error)
-        else:
-            val_f = v
-
-        if errors:
-            raise ValidationError(errors, cls)
-
-        valid_value = cls.__parse__(val_f)
-        
-        return valid_value
+        if len(field.sub_fields)>1:
+            raise ValidationError(['to many field conparser() built type require and accept only one argument'], cls)
+        valid_value, error = field.sub_fields[0].validate(v, {}, loc='value')
+        if error:
+            raise ValidationError([error], cls)
+        return cls.__parse__(valid_value)
     
     def __repr__(self):
         return f'{self.__class__.__name__}({super().__repr__()})'
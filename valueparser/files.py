@@ -0,0 +1,143 @@
+""" Out-of-core parsing of memory-mapped .npy and raw binary files """
+import os
+from typing import Any, Optional, Union
+
+from .engine import _get_numpy, _into_stages_of
+
+ON_FILE_ERROR_POLICIES = ("raise", "default")
+
+
+def parse_file(
+        parser,
+        path: Union[str, os.PathLike],
+        dtype: Any = None,
+        chunk_size: int = 1_000_000,
+        out: Union[str, os.PathLike, None] = None,
+        out_dtype: Any = None,
+        offset: int = 0,
+        on_error: str = "raise",
+        default: Any = 0,
+        errors: Optional[list] = None
+    ):
+    """ Parse a memory-mapped file chunk by chunk and write the result to a memory-mapped file
+
+    Only one chunk of values is in memory at a time. Chunks are parsed with ``parse_into``
+    (without copy) when all the parser stages allow it, otherwise with ``parse_array``.
+
+    Args:
+        parser: any parser object
+        path: a .npy file or a raw binary file (then dtype is required)
+        dtype (optional): type of the raw binary file values
+        chunk_size: number of values (rows for a 2d array) parsed at once
+        out (optional): output file path, a .npy file or a raw binary file. It can be the input
+            path to parse the file in place. If None, the result is returned in memory.
+            In place with on_error="raise", all the chunks are validated before the first one is
+            written back (the file is parsed twice), the file is unchanged if a value is rejected.
+        out_dtype (optional): type of the output values, default is the input type
+        offset: offset in bytes of the first value of a raw binary file
+        on_error: "raise" raise a ValueError at the first rejected value, "default" write
+            the default value in place of the rejected values
+        default: value written in place of rejected values when on_error="default"
+        errors (optional, list): if given, the indexes of rejected values are appended to it
+
+    Returns:
+        The output array, a numpy memmap if out is given
+    """
+    np = _get_numpy()
+    if on_error not in ON_FILE_ERROR_POLICIES:
+        raise ValueError(f"on_error must be one of {', '.join(ON_FILE_ERROR_POLICIES)} got {on_error!r}")
+    if chunk_size<1:
+        raise ValueError("chunk_size must be strictly positive")
+
+    in_place = out is not None and os.path.abspath(out) == os.path.abspath(path)
+    values = _open_input(np, path, dtype, offset, "r+" if in_place else "r")
+    out_dtype = values.dtype if out_dtype is None else np.dtype(out_dtype)
+    if in_place:
+        if out_dtype != values.dtype:
+            raise ValueError("out_dtype must be the file type to parse a file in place")
+        result = values
+    elif out is None:
+        result = np.empty(values.shape, dtype=out_dtype)
+    else:
+        result = _open_output(np, out, out_dtype, values.shape)
+
+    parse_chunk = _chunk_parser(parser)
+    row_size = int(np.prod(values.shape[1:])) # indexes are flat indexes 
+    if in_place and on_error == "raise":
+        # chunks are parsed into a scratch chunk first, nothing is written if a value is rejected
+        scratch = np.empty(values[:chunk_size].shape, dtype=out_dtype)
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start+chunk_size]
+            rejected = parse_chunk(np, chunk, scratch[:len(chunk)])
+            if rejected is not None and rejected.any():
+                _raise_rejected(chunk, rejected, start*row_size)
+
+    for start in range(0, len(values), chunk_size):
+        chunk, out_chunk = values[start:start+chunk_size], result[start:start+chunk_size]
+        rejected = parse_chunk(np, chunk, out_chunk)
+        if rejected is None or not rejected.any():
+            continue
+        if on_error == "raise":
+            _raise_rejected(chunk, rejected, start*row_size)
+        indexes = np.flatnonzero(rejected)
+        out_chunk[rejected] = default
+        if errors is not None:
+            errors.extend( (indexes+start*row_size).tolist() )
+
+    if isinstance(result, np.memmap):
+        result.flush()
+    return result
+
+
+def _raise_rejected(chunk, rejected, offset: int):
+    index = int(rejected.reshape(-1).argmax()) # first rejected value 
+    raise ValueError(f"value {chunk.flat[index].item()!r} at index {offset+index} was rejected")
+
+
+def _open_input(np, path, dtype, offset: int, mode: str):
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode=mode)
+    if dtype is None:
+        raise ValueError("dtype is required to parse a raw binary file")
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset)
+
+
+def _open_output(np, path, dtype, shape: tuple):
+    if str(path).endswith(".npy"):
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+
+
+def _chunk_parser(parser):
+    """ Return a function(np, chunk, out_chunk) -> rejected mask or None """
+    try:
+        _into_stages_of(parser)
+    except TypeError: # some stages cannot be parsed into a buffer 
+        return _parse_chunk_array(parser)
+    return _parse_chunk_into(parser)
+
+
+def _parse_chunk_into(parser):
+    def parse_chunk(np, chunk, out_chunk):
+        _, rejected = parser.parse_into(chunk, out_chunk)
+        return rejected
+    return parse_chunk
+
+
+def _parse_chunk_array(parser):
+    def parse_chunk(np, chunk, out_chunk):
+        try:
+            out_chunk[...] = parser.parse_array(chunk)
+            return None
+        except (ValueError, TypeError):
+            pass
+        # find the rejected values one by one
+        rejected = np.zeros(chunk.shape, dtype=bool)
+        for i, value in enumerate(chunk.reshape(-1).tolist()):
+            ok, parsed = parser.try_parse(value)
+            if ok:
+                out_chunk.flat[i] = parsed
+            else:
+                rejected.flat[i] = True
+        return rejected
+    return parse_chunk
@@ -0,0 +1,188 @@
+""" Opt-in instrumentation of parsers: call counts, rejections and sampled latencies
+
+Usage::
+
+    from valueparser.instrument import instrumented
+
+    with instrumented(sample_every=10) as stats:
+        ratio_parser.parse_many(values)
+    stats.to_dict()
+
+When no instrumentation is active the parsers run their original code, the
+instrumentation has no cost.  Only the ``parse``, ``parse_many`` and ``try_parse``
+methods of :class:`BaseParser` are instrumented (not ``parse_array`` or compiled functions).
+"""
+from contextlib import contextmanager
+from enum import Enum
+import json
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .engine import BaseParser, _CombinedParser, _stage_name
+
+
+class CallStats:
+    """ Statistics of one parser or one parser stage """
+    __slots__ = ("calls", "rejections", "histogram", "samples", "sampled_time")
+
+    def __init__(self):
+        self.calls = 0
+        self.rejections: Dict[str, int] = {}
+        # sampled latencies, key k counts latencies in [2**(k-1), 2**k[ ns
+        self.histogram: Dict[int, int] = {}
+        self.samples = 0
+        self.sampled_time = 0
+
+    def record_time(self, ns: int) -> None:
+        bucket = ns.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0)+1
+        self.samples += 1
+        self.sampled_time += ns
+
+    def record_rejection(self, err: Exception) -> None:
+        code = getattr(err, "error_code", None)
+        if isinstance(code, Enum):
+            key = code.name
+        elif code is None:
+            key = type(err).__name__
+        else:
+            key = str(code)
+        self.rejections[key] = self.rejections.get(key, 0)+1
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "rejections": dict(self.rejections),
+            "samples": self.samples,
+            "mean_ns": self.sampled_time/self.samples if self.samples else None,
+            "histogram_ns": {f"<{2**bucket}": count for bucket, count in sorted(self.histogram.items())},
+        }
+
+
+class ParserStats:
+    """ Collect statistics per parser class name and per stage
+
+    Args:
+        sample_every: the latency is measured every ``sample_every`` calls
+    """
+    def __init__(self, sample_every: int = 100):
+        if sample_every<1:
+            raise ValueError("sample_every must be strictly positive")
+        self.sample_every = sample_every
+        self.parsers: Dict[str, CallStats] = {}
+        self.stages: Dict[Tuple[str, str], CallStats] = {}
+
+    def _parser_stats(self, parser_name: str) -> CallStats:
+        try:
+            return self.parsers[parser_name]
+        except KeyError:
+            stats = self.parsers[parser_name] = CallStats()
+            return stats
+
+    def _stage_stats(self, parser_name: str, stage_name: str) -> CallStats:
+        try:
+            return self.stages[(parser_name, stage_name)]
+        except KeyError:
+            stats = self.stages[(parser_name, stage_name)] = CallStats()
+            return stats
+
+    def _call(self, stats: CallStats, func, *args):
+        stats.calls += 1
+        try:
+            if stats.calls % self.sample_every:
+                return func(*args)
+            start = perf_counter_ns()
+            result = func(*args)
+            stats.record_time( perf_counter_ns()-start )
+            return result
+        except (ValueError, TypeError) as err:
+            stats.record_rejection(err)
+            raise
+
+    def parse(self, parser: BaseParser, value: Any) -> Any:
+        """ parse a value with an instrumented parser """
+        Parser = type(parser)
+        parser_name = Parser.__name__
+        config = parser.__config__.__get_params__()
+        return self._call( self._parser_stats(parser_name), self._parse_stages, Parser, parser_name, value, config)
+
+    def _parse_stages(self, Parser, parser_name, value, config):
+        for stage_name, fparse in _iter_named_stages(Parser):
+            value = self._call( self._stage_stats(parser_name, stage_name), fparse, value, config)
+        return value
+
+    def clear(self) -> None:
+        self.parsers.clear()
+        self.stages.clear()
+
+    def to_dict(self) -> dict:
+        """ Export statistics as a dictionary {parser_name: {..., "stages": {stage_name: {...}}}} """
+        result = {}
+        for parser_name, stats in self.parsers.items():
+            result[parser_name] = {**stats.to_dict(), "stages": {}}
+        for (parser_name, stage_name), stats in self.stages.items():
+            result.setdefault(parser_name, {"stages": {}})["stages"][stage_name] = stats.to_dict()
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def _iter_named_stages(Parser) -> Iterator[Tuple[str, Any]]:
+    if issubclass(Parser, _CombinedParser):
+        return zip( (_stage_name(stage) for stage in Parser.__get_stages__()), Parser.__get_parsers__())
+    return iter( [(Parser.__name__, Parser.__parse__)] )
+
+
+_stack: List[ParserStats] = []
+_original_methods = {}
+
+
+def _instrumented_parse(self, value):
+    return _stack[-1].parse(self, value)
+
+
+def _instrumented_parse_many(self, values):
+    parse = _stack[-1].parse
+    return [parse(self, value) for value in values]
+
+
+def _instrumented_try_parse(self, value):
+    try:
+        return (True, _stack[-1].parse(self, value))
+    except (ValueError, TypeError) as err:
+        return (False, err)
+
+
+_instrumented_methods = {
+    "parse": _instrumented_parse,
+    "parse_many": _instrumented_parse_many,
+    "try_parse": _instrumented_try_parse,
+}
+
+
+@contextmanager
+def instrumented(stats: Optional[ParserStats] = None, sample_every: int = 100) -> Iterator[ParserStats]:
+    """ Instrument all parsers inside the context and yield the :class:`ParserStats`
+
+    Contexts can be nested, the inner one collects the statistics.
+
+    Args:
+        stats (optional): a ParserStats to fill, a new one is created if not given
+        sample_every: latency sampling period (in number of calls) of a new ParserStats
+    """
+    if stats is None:
+        stats = ParserStats(sample_every)
+    if not _stack:
+        for name, method in _instrumented_methods.items():
+            _original_methods[name] = BaseParser.__dict__[name]
+            setattr(BaseParser, name, method)
+    _stack.append(stats)
+    try:
+        yield stats
+    finally:
+        _stack.pop()
+        if not _stack:
+            for name, method in _original_methods.items():
+                setattr(BaseParser, name, method)
+            _original_methods.clear()
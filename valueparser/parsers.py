@@ -1,37 +1,84 @@
-from typing import Any, Optional, Type, Union
-from valueparser.engine import BaseParser, parser_class, register_parser_factory
+from collections import OrderedDict, namedtuple
+from typing import Any, Iterable, Optional, Type, Union
+from valueparser.engine import BaseParser, parser, parser_class, register_parser_factory, cached_on_params, _get_numpy
+from valueparser.engine import _exact_ints, _in_int64_range
 from enum import Enum, EnumMeta, auto
 import datetime 
+from functools import lru_cache
 import math
+from threading import Lock
+from time import monotonic
 
 __all__ = ["Errors", "ParseError", "Bounded", "Clipped", "Listed", "Enumerated", 
-        "Default", "Rounded", "Formated", "Modulo", "Default", "Timestamp", "DateTime"
+        "Default", "Rounded", "Formated", "Modulo", "Default", "Timestamp", "DateTime", 
+        "Dispatch", "Cached"
         ]
 
 
 class Errors(Enum):
     OUT_OF_BOUND = auto()
     NOT_LISTED = auto() 
+    UNEXPECTED_TYPE = auto()
+    INVALID_FIELDS = auto()
+    MISSING_FIELD = auto()
 
 class ParseError(ValueError):
-    def __init__(self, code, message):
+    """ Error of a rejected value 
+
+    If args are given, message is a format string completed with args only 
+    when the error message is needed.  
+    """
+    def __init__(self, code, message, *args):
         self.error_code = code
-        super().__init__(message)
+        # message and args are kept in self.args, not in the instance __dict__ 
+        # used by pydantic as error context 
+        super().__init__(message, *args)
+    
+    def __str__(self):
+        message, *args = self.args 
+        if args:
+            return message.format(*args)
+        return message 
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self)!r})"
+    
+    def __reduce__(self):
+        # errors raised in worker processes (see parse_parallel) are pickled
+        return (type(self), (self.error_code, *self.args))
+
 
 
+_python_types = {tpe.__name__.capitalize():tpe for tpe in [int, float, complex, bool, str, tuple, set, list]}
+""" Python types with a global parser (e.g. Int), parsers are built on first access """
+__all__.extend(_python_types)
 
-def _make_global_parsers(types):
-    """ Build automaticaly some parser from python types """
-    for tpe in types:        
-        Tpe = tpe.__name__.capitalize()
-        
-        cls = parser_class(tpe, name=Tpe) 
-        register_parser_factory(cls)
-        register_parser_factory(tpe.__name__, cls)
-        # record_class(cls, type=tpe.__name__)
-        globals()[ Tpe ] = cls
-        __all__.append( Tpe) 
-_make_global_parsers([int, float, complex, bool, str, tuple, set, list])
+def _make_global_parser(Tpe: str) -> Type[BaseParser]:
+    """ Build automaticaly a parser from a python type, register it and store it in the module """
+    tpe = _python_types[Tpe]
+    cls = parser_class(tpe, name=Tpe) 
+    cls.__module__ = __name__
+    register_parser_factory(cls)
+    register_parser_factory(tpe.__name__, cls)
+    globals()[ Tpe ] = cls
+    return cls 
+
+def __getattr__(name: str):
+    if name in _python_types:
+        return _make_global_parser(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _load_builtin_parser(name: str) -> None:
+    """ Make sure the parser of a python type is built and registered
+
+    name can be the type name (e.g. "int") or the parser name (e.g. "Int")
+    """
+    if not isinstance(name, str):
+        return 
+    Tpe = name.capitalize()
+    tpe = _python_types.get(Tpe)
+    if tpe is not None and name in (Tpe, tpe.__name__) and Tpe not in globals():
+        _make_global_parser(Tpe)
 
 
 
@@ -44,10 +91,56 @@ class Bounded(BaseParser):
     @staticmethod
     def __parse__(value: float, params: Config) -> float:        
         if value<params.min:
-            raise ParseError(Errors.OUT_OF_BOUND, f'{value} is lower than {params.min}')
+            raise ParseError(Errors.OUT_OF_BOUND, '{} is lower than {}', value, params.min)
         if value>params.max :
-            raise ParseError(Errors.OUT_OF_BOUND, f'{value} is higher than {params.max}')
+            raise ParseError(Errors.OUT_OF_BOUND, '{} is higher than {}', value, params.max)
         return value
+    
+    @staticmethod
+    def __try_parse__(value: float, params: Config) -> tuple:
+        try:
+            if value<params.min:
+                return (False, ParseError(Errors.OUT_OF_BOUND, '{} is lower than {}', value, params.min))
+            if value>params.max :
+                return (False, ParseError(Errors.OUT_OF_BOUND, '{} is higher than {}', value, params.max))
+        except (ValueError, TypeError) as err: # e.g. value not comparable to a float
+            return (False, err)
+        return (True, value)
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        error, code = const(ParseError), const(Errors.OUT_OF_BOUND)
+        vmin, vmax = const(params.min), const(params.max)
+        return [
+            f"if value<{vmin}: raise {error}({code}, '{{}} is lower than {{}}', value, {vmin})",
+            f"if value>{vmax}: raise {error}({code}, '{{}} is higher than {{}}', value, {vmax})",
+        ]
+
+    @staticmethod
+    def __parse_array__(values, params: Config):
+        lower = values<params.min
+        if lower.any():
+            raise ParseError(Errors.OUT_OF_BOUND, '{} is lower than {}', values[lower][0], params.min)
+        higher = values>params.max
+        if higher.any():
+            raise ParseError(Errors.OUT_OF_BOUND, '{} is higher than {}', values[higher][0], params.max)
+        return values
+    
+    @staticmethod
+    def __parse_into__(values, out, params: Config):
+        np = _get_numpy()
+        rejected = (values<params.min) | (values>params.max)
+        if out is not values:
+            np.copyto(out, values, casting="unsafe")
+        return rejected 
+
+    @staticmethod
+    def __is_noop__(params: Config) -> bool:
+        return params.min == -math.inf and params.max == math.inf 
+
+# a repeated stage, with the same configuration, is redundant 
+Bounded.__covers__ = (Bounded,)
+Bounded.__array_params__ = ("min", "max")
 
 @register_parser_factory
 class Clipped(BaseParser):
@@ -58,13 +151,95 @@ class Clipped(BaseParser):
     @staticmethod
     def __parse__(value: float, params: Config)-> float:
         return min(params.max,max(params.min, value))
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        return [f"value = min({const(params.max)}, max({const(params.min)}, value))"]
+    
+    @staticmethod
+    def __parse_array__(values, params: Config):
+        # infinite bounds are skiped to keep the array type unchanged 
+        # bounds can also be arrays of bounds per column (see ParserBank)
+        np = _get_numpy()
+        vmin = None if np.ndim(params.min)==0 and params.min == -math.inf else params.min
+        vmax = None if np.ndim(params.max)==0 and params.max == math.inf else params.max 
+        if vmin is not None or vmax is not None:
+            values = np.clip(values, vmin, vmax)
+        if values.dtype.kind == "f":
+            # as __parse__, NaN is clipped to min 
+            nan = np.isnan(values)
+            if nan.any():
+                values = np.where(nan, params.min, values)
+        return values
+
+    @staticmethod
+    def __parse_into__(values, out, params: Config):
+        np = _get_numpy()
+        vmin = None if params.min == -math.inf else params.min
+        vmax = None if params.max == math.inf else params.max 
+        if vmin is None and vmax is None:
+            np.copyto(out, values, casting="unsafe")
+        else:
+            np.clip(values, vmin, vmax, out=out, casting="unsafe")
+        if values.dtype.kind == "f":
+            nan = np.isnan(values)
+            if nan.any():
+                out[nan] = params.min
+
+Clipped.__covers__ = (Clipped, Bounded) # clipped values are within bounds
+Clipped.__array_params__ = ("min", "max")
 
 
 class _Empty_:
-    pass
+    # a singleton, pydantic copies of field defaults keep the same instance 
+    def __copy__(self):
+        return self
+    def __deepcopy__(self, memo):
+        return self
+    def __reduce__(self):
+        return "_empty_"
 _empty_ = _Empty_()
 
 
+class _ItemIndex:
+    """ Hash index of a list of items, unhashable items are checked one by one """
+    def __init__(self, items: list):
+        hashable, unhashable = [], []
+        for item in items:
+            try:
+                hash(item)
+            except TypeError:
+                unhashable.append(item)
+            else:
+                hashable.append(item)
+        self.items = items
+        self.hashable = frozenset(hashable)
+        self.unhashable = unhashable 
+        self._repr = None 
+    
+    def __contains__(self, value):
+        try:
+            if value in self.hashable:
+                return True
+        except TypeError: # unhashable value 
+            return value in self.items 
+        return bool(self.unhashable) and value in self.unhashable
+    
+    def __str__(self):
+        # used in error messages, the list is truncated  
+        if self._repr is None:
+            items = self.items
+            string_items = ", ".join( repr(i) for i in items[:_max_items_in_message])
+            if len(items)>_max_items_in_message:
+                string_items += f", ... ({len(items)-_max_items_in_message} more)"
+            self._repr = string_items
+        return self._repr
+
+_max_items_in_message = 10
+
+def _listed_index(params) -> _ItemIndex:
+    return _ItemIndex(params.items)
+
 @register_parser_factory
 class Listed(BaseParser):
     class Config:
@@ -73,30 +248,128 @@ class Listed(BaseParser):
 
     @staticmethod
     def __parse__(value: Any, params: Config) -> Any:
-        if value in params.items:
+        index = cached_on_params(params, _listed_index)
+        if value in index:
             return value
         if not isinstance(params.default_item, _Empty_):
             return params.default_item
-        
-        string_items = ", ".join( repr(i) for i in params.items) 
-        raise ParseError(Errors.NOT_LISTED, f"item {value!r} is not in the list: {string_items} ") 
+        raise ParseError(Errors.NOT_LISTED, "item {!r} is not in the list: {} ", value, index) 
+    
+    @staticmethod
+    def __try_parse__(value: Any, params: Config) -> tuple:
+        index = cached_on_params(params, _listed_index)
+        if value in index:
+            return (True, value)
+        if not isinstance(params.default_item, _Empty_):
+            return (True, params.default_item)
+        return (False, ParseError(Errors.NOT_LISTED, "item {!r} is not in the list: {} ", value, index))
+
+Listed.__covers__ = (Listed,)
+
+
+class _MemberLookup:
+    """ Direct value to member lookup of an Enum class 
+
+    Return the _empty_ instance when the value does not match any member
+    """
+    def __init__(self, enumerator: Type[Enum], names: bool = False, ignore_case: bool = False):
+        table = {}
+        members = enumerator.__members__
+        for member in members.values():
+            try:
+                table.setdefault(member.value, member)
+            except TypeError: # unhashable value, found by the enumerator itself
+                pass
+            # members are valid input, as enumerator(member) 
+            table.setdefault(member, member)
+        if names:
+            for name, member in members.items():
+                table.setdefault(name, member)
+        if ignore_case:
+            for key, member in list(table.items()):
+                if isinstance(key, str):
+                    table.setdefault(key.lower(), member)
+
+        self.enumerator = enumerator
+        self.table = table
+        self.ignore_case = ignore_case
+        # e.g. Flag resolve values combination with _missing_ 
+        self.has_missing = getattr(enumerator._missing_, "__func__", None) is not Enum._missing_.__func__
+    
+    def __call__(self, value: Any) -> Any:
+        try:
+            return self.table[value]
+        except KeyError:
+            if self.ignore_case and isinstance(value, str):
+                member = self.table.get(value.lower(), _empty_)
+                if member is not _empty_:
+                    return member
+            if not self.has_missing:
+                return _empty_
+        except TypeError:
+            pass 
+        try:
+            return self.enumerator(value)
+        except ValueError:
+            return _empty_
+    
+    def many(self, values: Iterable) -> list:
+        """ Lookup several values, unknown values are returned as _empty_ """
+        table = self.table
+        try:
+            return [table[value] for value in values]
+        except (KeyError, TypeError):
+            return [self(value) for value in values]
+    
+    def error(self, value: Any) -> ParseError:
+        return ParseError( Errors.NOT_LISTED, "{!r} is not a valid {}", value, self.enumerator.__qualname__)
 
+def _enumerated_lookup(params) -> _MemberLookup:
+    return _MemberLookup(params.enumerator, params.names, params.ignore_case)
 
 @register_parser_factory
 class Enumerated(BaseParser):
+    """ Parse a value to an Enum member 
+
+    The value is matched against the member values and, optionaly, against member names. 
+    """
     class Config:
         enumerator: Type[Enum]
+        names: bool = False 
+        ignore_case: bool = False 
     
     @staticmethod
     def __parse__(value: Any, params: Config) -> Any:
-        try:
-            return params.enumerator(value)
-        except ValueError as err:
-            raise ParseError( Errors.NOT_LISTED, str(err))
+        lookup = cached_on_params(params, _enumerated_lookup)
+        member = lookup(value)
+        if member is _empty_:
+            raise lookup.error(value)
+        return member
+    
+    @staticmethod
+    def __try_parse__(value: Any, params: Config) -> tuple:
+        lookup = cached_on_params(params, _enumerated_lookup)
+        member = lookup(value)
+        if member is _empty_:
+            return (False, lookup.error(value))
+        return (True, member)
+    
+    @staticmethod
+    def __parse_many__(values: Iterable, params: Config) -> list:
+        values = list(values)
+        lookup = cached_on_params(params, _enumerated_lookup)
+        members = lookup.many(values)
+        for value, member in zip(values, members):
+            if member is _empty_:
+                raise lookup.error(value)
+        return members
 
 class _DumyError(Enum):
     pass 
 
+def _error_lookup(params) -> _MemberLookup:
+    return _MemberLookup(params.Error)
+
 @register_parser_factory
 class Error(BaseParser):
     class Config:
@@ -105,12 +378,35 @@ class Error(BaseParser):
     
     @staticmethod
     def __parse__(value: Any, params: Config) -> Any:
-        try:
-            return params.Error(value)
-        except ValueError as err:
+        lookup = cached_on_params(params, _error_lookup)
+        member = lookup(value)
+        if member is _empty_:
             if params.UNKNOWN is None:
-                raise ParseError( Errors.NOT_LISTED, str(err))
+                raise lookup.error(value)
             return params.UNKNOWN
+        return member
+    
+    @staticmethod
+    def __try_parse__(value: Any, params: Config) -> tuple:
+        lookup = cached_on_params(params, _error_lookup)
+        member = lookup(value)
+        if member is _empty_:
+            if params.UNKNOWN is None:
+                return (False, lookup.error(value))
+            return (True, params.UNKNOWN)
+        return (True, member)
+    
+    @staticmethod
+    def __parse_many__(values: Iterable, params: Config) -> list:
+        values = list(values)
+        lookup = cached_on_params(params, _error_lookup)
+        members = lookup.many(values)
+        for i, (value, member) in enumerate(zip(values, members)):
+            if member is _empty_:
+                if params.UNKNOWN is None:
+                    raise lookup.error(value)
+                members[i] = params.UNKNOWN
+        return members
 
 
 @register_parser_factory
@@ -121,6 +417,31 @@ class Rounded(BaseParser):
     @staticmethod
     def __parse__(value: float, params: Config) -> Union[int, float]:
         return round(value, params.ndigits) 
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        return [f"value = round(value, {const(params.ndigits)})"]
+    
+    @staticmethod
+    def __parse_array__(values, params: Config):
+        np = _get_numpy()
+        if params.ndigits is None:
+            if values.dtype.kind in "fc" and not np.isfinite(values).all():
+                raise ValueError("cannot convert a non finite value to integer")
+            if values.dtype.kind == "f" and not _in_int64_range(values):
+                return _exact_ints(values, round) # as round()
+            return np.round(values).astype(int)
+        return np.round(values, params.ndigits)
+
+    @staticmethod
+    def __parse_into__(values, out, params: Config):
+        np = _get_numpy()
+        if out.dtype.kind in "iu": # np.round can only write floats
+            np.copyto(out, np.round(values, params.ndigits or 0), casting="unsafe")
+        else:
+            np.round(values, params.ndigits or 0, out=out)
+
+Rounded.__covers__ = (Rounded,)
 
 @register_parser_factory
 class Formated(BaseParser):
@@ -130,6 +451,10 @@ class Formated(BaseParser):
     @staticmethod
     def __parse__(value: float, params: Config) -> str:
         return params.format%( value, ) 
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        return [f"value = {const(params.format)}%(value,)"]
 
 @register_parser_factory
 class Modulo(BaseParser):
@@ -139,6 +464,22 @@ class Modulo(BaseParser):
     @staticmethod
     def __parse__( value: float, params: Config) -> float:
         return value%params.modulo
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        return [f"value = value%{const(params.modulo)}"]
+    
+    @staticmethod
+    def __parse_array__(values, params: Config):
+        np = _get_numpy()
+        return np.mod(values, params.modulo)
+
+    @staticmethod
+    def __parse_into__(values, out, params: Config):
+        np = _get_numpy()
+        np.mod(values, params.modulo, out=out, casting="unsafe")
+
+Modulo.__array_params__ = ("modulo",)
 
 @register_parser_factory
 class Default(BaseParser):
@@ -151,6 +492,81 @@ class Default(BaseParser):
             return params.default
         else:
             return value
+    
+    @staticmethod
+    def __parse_source__(params: Config, const) -> list:
+        return [f"if value is None: value = {const(params.default)}"]
+
+Default.__covers__ = (Default,)
+
+# ISO strings are often repeated (e.g. second resolution time stamps)
+_ISO_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_ISO_CACHE_SIZE)
+def _iso_to_timestamp(value: str) -> float:
+    return datetime.datetime.fromisoformat( value).timestamp()
+
+@lru_cache(maxsize=_ISO_CACHE_SIZE)
+def _iso_to_datetime(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat( value)
+
+_timestamp_converters = {
+    datetime.datetime: datetime.datetime.timestamp, 
+    str: _iso_to_timestamp, 
+    float: float, 
+    int: float, 
+}
+
+def _to_timestamp(value: Union[str, datetime.datetime, float]) -> float:
+    try:
+        converter = _timestamp_converters[type(value)]
+    except KeyError: # sub-classes
+        if isinstance( value, datetime.datetime):
+            return value.timestamp()
+        elif isinstance(value, str):
+            return _iso_to_timestamp( str(value) )
+        elif isinstance( value, (float, int)):
+            return float(value)
+        raise ValueError(f"expecting a datetime, a str (ISO) or a float got a {type(value)}")
+    return converter(value)
+
+def _return_value(value):
+    return value 
+
+_datetime_converters = {
+    datetime.datetime: _return_value, 
+    str: _iso_to_datetime, 
+    float: datetime.datetime.fromtimestamp, 
+}
+
+def _to_naive_datetime(value: Union[str, datetime.datetime, float]) -> datetime.datetime:
+    dt = _to_datetime(value)
+    if dt.tzinfo is not None:
+        raise ValueError(f"timezone aware datetime {dt} cannot be stored in a datetime64 array")
+    return dt 
+
+def _to_datetime(value: Union[str, datetime.datetime, float]) -> datetime.datetime:
+    try:
+        converter = _datetime_converters[type(value)]
+    except KeyError: # sub-classes
+        if isinstance(value, datetime.datetime):
+            return value 
+        if isinstance(value, str):
+            return _iso_to_datetime( str(value) )
+        if isinstance(value, float):
+            return datetime.datetime.fromtimestamp( value) 
+        raise ValueError(f"expecting a datetime, a str (ISO) or a float got a {type(value)}")
+    return converter(value)
+
+def _convert_unique(values, func, dtype):
+    """ Convert only unique values of an array and return a new array of dtype """
+    np = _get_numpy()
+    try:
+        uniques, inverse = np.unique(values, return_inverse=True)
+    except TypeError: # not sortable, e.g. mixed types 
+        return np.array( [func(value) for value in values.tolist()], dtype=dtype)
+    converted = np.array( [func(value) for value in uniques.tolist()], dtype=dtype)
+    return converted[inverse.reshape(values.shape)]
 
 @register_parser_factory
 class Timestamp(BaseParser):
@@ -159,16 +575,18 @@ class Timestamp(BaseParser):
         time_offset : float = 0.0
     @staticmethod 
     def __parse__(value: Union[str, datetime.datetime, float], config: Config) -> float:
-        if isinstance( value, datetime.datetime):
-            time = value.timestamp()
-        elif isinstance(value, str):
-            time = datetime.datetime.fromisoformat( value).timestamp()
-        elif isinstance( value, (float, int)):
-            time =  float(value)
+        return _to_timestamp(value)+config.time_offset
+    
+    @staticmethod
+    def __parse_array__(values, config: Config):
+        """ Return an array of float64 timestamps """
+        if values.dtype.kind in "iuf":
+            times = values.astype("float64")
         else:
-            raise ValueError(f"expecting a datetime, a str (ISO) or a float got a {type(value)}")
-        return time+config.time_offset
+            times = _convert_unique(values, _to_timestamp, "float64")
+        return times+config.time_offset
 
+Timestamp.__array_params__ = ("time_offset",)
 
 
 @register_parser_factory
@@ -176,13 +594,218 @@ class DateTime(BaseParser):
     """ Parse a datetime, a string (ISO format) or a float(timestamp)  to a datetime object """
     @staticmethod
     def __parse__(value:  Union[str, datetime.datetime, float], config)-> datetime.datetime:
-        if isinstance(value, datetime.datetime):
-            return value 
-        
-        if isinstance(value, str):
-            return datetime.datetime.fromisoformat( value)
+        return _to_datetime(value)
+    
+    @staticmethod
+    def __parse_array__(values, config):
+        """ Return an array of datetime64 
+
+        datetime64 has no time zone, timezone aware values (e.g. ISO strings with an offset) 
+        are rejected, use ``parse_many`` to keep them. 
+        """
+        if values.dtype.kind == "M":
+            return values
+        return _convert_unique(values, _to_naive_datetime, "datetime64[us]")
+
+
+
+class _TypeDispatcher:
+    """ Parse a value with the branch of its type 
+
+    The branch of a type not in the table is resolved once from the type MRO 
+    (e.g. a bool is parsed by the int branch) and stored. 
+    """
+    def __init__(self, branches: dict):
+        table = {}
+        for types, spec in branches.items():
+            func = _return_value if spec is None else parser(spec).compile()
+            for tpe in (types if isinstance(types, tuple) else (types,)):
+                if not isinstance(tpe, type):
+                    raise ValueError(f"Dispatch branches must be keyed by types, got {tpe!r}")
+                table[tpe] = func 
+        self.branches = table 
+        self.resolved = dict(table)
+    
+    def resolve(self, tpe: type):
+        for base in tpe.__mro__:
+            func = self.branches.get(base)
+            if func is not None:
+                break
+        else:
+            func = self.reject 
+        self.resolved[tpe] = func 
+        return func 
 
-        if isinstance(value, float):
-            return datetime.datetime.fromtimestamp( value) 
-        raise ValueError(f"expecting a datetime, a str (ISO) or a float got a {type(value)}")
+    def reject(self, value: Any):
+        raise self.error(value)
+    
+    def error(self, value: Any) -> ParseError:
+        return ParseError(Errors.UNEXPECTED_TYPE, "no parser for {!r} of type {}", 
+                          value, type(value).__qualname__)
 
+    def __call__(self, value: Any) -> Any:
+        try:
+            func = self.resolved[type(value)]
+        except KeyError:
+            func = self.resolve(type(value))
+        return func(value)
+
+def _type_dispatcher(params) -> _TypeDispatcher:
+    return _TypeDispatcher(params.branches)
+
+@register_parser_factory
+class Dispatch(BaseParser):
+    """ Parse a value with the parser of its type 
+
+    branches is a dictionary of type -> parser, a parser is anything accepted by 
+    :func:`parser` or None to leave the value unchanged. A tuple of types can be used as key.
+    A value of a sub-type is parsed by the branch of its closest parent type, 
+    the ``object`` branch (if any) catches all types.
+
+    Exemple:: 
+
+        Dispatch( branches={ (int, float): (float, Clipped(max=1)), str: Enumerated(enumerator=E) } )
+    """
+    class Config:
+        branches: dict = {}
+
+    @staticmethod
+    def __parse__(value: Any, params: Config) -> Any:
+        return cached_on_params(params, _type_dispatcher)(value) 
+    
+    @staticmethod
+    def __parse_many__(values: Iterable, params: Config) -> list:
+        dispatch = cached_on_params(params, _type_dispatcher)
+        return [dispatch(value) for value in values]
+
+
+ParseCacheInfo = namedtuple("ParseCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+class _ParseCache:
+    """ LRU cache of parse outcomes keyed by (type, value) 
+
+    The type is part of the key because equal values of different types (e.g. 1, 1.0 
+    and True) may be parsed differently. Unhashable values are parsed without cache.
+    """
+    def __init__(self, params):
+        self.func = parser(params.parser).compile()
+        self.maxsize = params.maxsize
+        self.ttl = params.ttl 
+        self.cache_errors = params.cache_errors 
+        self.entries = OrderedDict() # key -> (ok, value_or_error, deadline)
+        self.lock = Lock()
+        self.hits = self.misses = self.evictions = 0 
+
+    def get(self, value: Any) -> tuple:
+        """ Return (key, entry), key is None for an unhashable value, entry is None if not cached 
+
+        Lookups do not take the lock, hit and miss counts are approximate when the 
+        cache is used from several threads.
+        """
+        key = (type(value), value)
+        try:
+            entry = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return key, None 
+        except TypeError: # unhashable value 
+            return None, None 
+        if entry[2] is not None and entry[2] <= monotonic(): # expired 
+            self.misses += 1
+            return key, None 
+        self.hits += 1
+        try:
+            self.entries.move_to_end(key)
+        except KeyError: # evicted meanwhile by an other thread
+            pass 
+        return key, entry 
+    
+    def set(self, key: tuple, ok: bool, result: Any) -> None:
+        if key is None or self.maxsize == 0:
+            return 
+        deadline = None if self.ttl is None else monotonic()+self.ttl 
+        with self.lock:
+            entries = self.entries
+            entries[key] = (ok, result, deadline)
+            entries.move_to_end(key)
+            if self.maxsize is not None and len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def __call__(self, value: Any) -> Any:
+        key, entry = self.get(value)
+        if entry is not None:
+            if entry[0]:
+                return entry[1]
+            raise entry[1].with_traceback(None)
+        try:
+            result = self.func(value)
+        except (ValueError, TypeError) as err:
+            if self.cache_errors:
+                self.set(key, False, err)
+            raise 
+        self.set(key, True, result)
+        return result 
+    
+    def try_parse(self, value: Any) -> tuple:
+        key, entry = self.get(value)
+        if entry is not None:
+            return (entry[0], entry[1])
+        try:
+            result = self.func(value)
+        except (ValueError, TypeError) as err:
+            if self.cache_errors:
+                self.set(key, False, err)
+            return (False, err)
+        self.set(key, True, result)
+        return (True, result)
+    
+    def info(self) -> ParseCacheInfo:
+        return ParseCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self.entries))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0 
+
+@register_parser_factory
+class Cached(BaseParser):
+    """ Memoize the results of a parser for repeated values 
+
+    parser is anything accepted by :func:`parser`. Results are kept in a LRU cache 
+    of maxsize entries (None: unbounded, 0: no cache) for ttl seconds (None: no expiration).
+    If cache_errors is True, rejected values are cached as well and raise the same error. 
+    The cache is reset when the configuration is changed. 
+
+    Exemple:: 
+
+        p = Cached( parser=(str, MyExpensiveLookup), maxsize=10_000, ttl=60.0 )
+        # or 
+        p = parser( (str, MyExpensiveLookup), cache=10_000 )
+    """
+    class Config:
+        parser: Any
+        maxsize: Optional[int] = 1024
+        ttl: Optional[float] = None 
+        cache_errors: bool = False 
+
+    @staticmethod
+    def __parse__(value: Any, params: Config) -> Any:
+        return cached_on_params(params, _ParseCache)(value) 
+    
+    @staticmethod
+    def __try_parse__(value: Any, params: Config) -> tuple:
+        return cached_on_params(params, _ParseCache).try_parse(value) 
+    
+    @staticmethod
+    def __parse_many__(values: Iterable, params: Config) -> list:
+        cache = cached_on_params(params, _ParseCache)
+        return [cache(value) for value in values]
+    
+    def cache_info(self) -> ParseCacheInfo:
+        """ Return the cache statistics (hits, misses, evictions, maxsize, currsize) """
+        return cached_on_params(self.__config__.__get_params__(), _ParseCache).info()
+    
+    def cache_clear(self) -> None:
+        """ Empty the cache and reset its statistics """
+        cached_on_params(self.__config__.__get_params__(), _ParseCache).clear()
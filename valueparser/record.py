@@ -0,0 +1,184 @@
+""" Parse records (dicts, tuples or csv rows) with one parser per field
+
+Usage::
+
+    from valueparser import RecordParser, Clipped, Enumerated
+
+    record_parser = RecordParser({"x": (float, Clipped(min=0, max=1)), "state": Enumerated(enumerator=State)})
+    record_parser.parse( {"x": "0.5", "state": 1} ) # {"x": 0.5, "state": State.ON}
+    record_parser.parse( ("0.5", 1) ) # values in the order of fields
+
+    with open("data.csv") as f:
+        for record in record_parser.parse_csv(f, on_error="skip"):
+            ...
+"""
+import csv
+from operator import itemgetter
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, Mapping, Optional
+
+from .engine import AbcParser, BaseParser, parser
+from .parsers import Errors, ParseError
+
+
+class RecordError(ParseError):
+    """ Error of a record with one or more invalid fields
+
+    errors is a dictionary of field name -> error
+    """
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+        super().__init__(Errors.INVALID_FIELDS, "invalid fields")
+
+    def __str__(self):
+        return "; ".join( f"{name}: {error}" for name, error in self.errors.items() )
+
+    def __reduce__(self):
+        return (RecordError, (self.errors,))
+
+
+def _missing_error(name: str) -> ParseError:
+    return ParseError(Errors.MISSING_FIELD, "missing field {!r}", name)
+
+
+class RecordParser(AbcParser):
+    """ Parse records with one parser per field
+
+    A record is a mapping (e.g. a dict) or a sequence of values in the order of fields
+    (e.g. a tuple or a csv row), parsed records are dictionaries. Extra keys or values
+    of a record are ignored. All invalid or missing fields of a record are reported
+    together in a :class:`RecordError`.
+
+    ``parse_many`` is columnar: each column of the records is parsed in one batch by the
+    ``parse_many`` method of its field parser.
+
+    Args:
+        fields: dictionary of field name -> anything accepted by :func:`parser`.
+            Field parsers are compiled, and compiled again when their configuration is changed.
+    """
+    def __init__(self, fields: Dict[str, Any]):
+        self._specs = dict(fields)
+        self.parsers = {name: parser(spec) for name, spec in self._specs.items()}
+        self.fields = tuple(self.parsers)
+        # compiled functions depend on the configuration snapshots of these parsers 
+        self._configured = [p for p in self.parsers.values() if isinstance(p, BaseParser)]
+        self._params: Optional[list] = None
+        self._items: tuple = ()
+
+    def __reduce__(self):
+        return (RecordParser, (self._specs,))
+
+    def _get_items(self) -> tuple:
+        """ Return the (name, compiled function) of fields for the current field configurations """
+        params = [p.__config__.__get_params__() for p in self._configured]
+        if params != self._params: # snapshots are compared by identity, they are rebuilt on change
+            self._items = tuple( (name, p.compile()) for name, p in self.parsers.items() )
+            self._params = params
+        return self._items
+
+    def parse(self, record: Any) -> dict:
+        items = self._get_items()
+        try:
+            if isinstance(record, dict):
+                return {name: func(record[name]) for name, func in items}
+            if isinstance(record, (tuple, list)) and len(record) >= len(items):
+                return {name: func(value) for (name, func), value in zip(items, record)}
+        except (ValueError, TypeError, KeyError, IndexError):
+            pass
+        # other records, missing or invalid fields: parse field per field to find all the errors
+        parsed, errors = self._parse_per_field(record)
+        if errors:
+            raise RecordError(errors)
+        return parsed
+
+    def _parse_per_field(self, record: Any) -> tuple:
+        parsed, errors = {}, {}
+        is_mapping = isinstance(record, Mapping)
+        for i, (name, func) in enumerate(self._get_items()):
+            try:
+                value = record[name] if is_mapping else record[i]
+            except (KeyError, IndexError):
+                errors[name] = _missing_error(name)
+                continue
+            try:
+                parsed[name] = func(value)
+            except (ValueError, TypeError) as err:
+                errors[name] = err
+        return parsed, errors
+
+    def parse_columns(self, columns: Mapping[str, Iterable]) -> Dict[str, list]:
+        """ Parse a dictionary of field name -> column of values
+
+        Each column is parsed by the ``parse_many`` method of its field parser. The first
+        error of each column is reported in a :class:`RecordError`.
+        """
+        parsed, errors = {}, {}
+        for name, field_parser in self.parsers.items():
+            try:
+                column = columns[name]
+            except KeyError:
+                errors[name] = _missing_error(name)
+                continue
+            try:
+                parsed[name] = field_parser.parse_many(column)
+            except (ValueError, TypeError) as err:
+                errors[name] = err
+        if errors:
+            raise RecordError(errors)
+        return parsed
+
+    def parse_many(self, records: Iterable) -> list:
+        """ Parse records column per column and return a list of dictionaries
+
+        If any value is rejected, records are parsed one by one to raise the
+        :class:`RecordError` of the first invalid record.
+        """
+        records = records if isinstance(records, list) else list(records)
+        if not records:
+            return []
+        keys = self.fields if isinstance(records[0], Mapping) else range(len(self.fields))
+        try:
+            columns = [ [record[key] for record in records] for key in keys]
+            parsed = [ field_parser.parse_many(column) for field_parser, column in zip(self.parsers.values(), columns)]
+        except (ValueError, TypeError, KeyError, IndexError):
+            return [self.parse(record) for record in records]
+        fields = self.fields
+        return [dict(zip(fields, values)) for values in zip(*parsed)]
+
+    def parse_csv(self, file: IO, header: bool = True, on_error: str = "raise", chunk_size: int = 1000,
+                    default: Any = None, errors: Optional[list] = None, **reader_kwargs) -> Iterator[dict]:
+        """ Lazily parse the rows of a csv file and yield records
+
+        Rows are read and parsed by chunks of chunk_size rows, see :func:`valueparser.engine.parse_iter`
+        for the on_error, default and errors arguments. Empty rows are skipped.
+
+        Args:
+            file: a file object open in text mode
+            header: if True the first row gives the column names, columns are matched with fields
+                by name. Otherwise columns are in the order of fields.
+            **reader_kwargs: passed to :func:`csv.reader` (e.g. delimiter)
+        """
+        rows = (row for row in csv.reader(file, **reader_kwargs) if row)
+        if header:
+            try:
+                names = next(rows)
+            except StopIteration:
+                return iter([])
+            missing = [name for name in self.fields if name not in names]
+            if missing:
+                raise ValueError(f"missing columns in csv header: {', '.join(missing)}")
+            rows = _select_columns(rows, [names.index(name) for name in self.fields], self.fields)
+        return self.parse_iter(rows, on_error, chunk_size, default, errors)
+
+
+def _select_columns(rows: Iterator[list], indexes: list, fields: tuple) -> Iterator:
+    """ Reorder the columns of rows in the order of fields """
+    if len(indexes) == 1:
+        index, = indexes
+        getter: Callable = lambda row: (row[index],)
+    else:
+        getter = itemgetter(*indexes)
+    for row in rows:
+        try:
+            yield getter(row)
+        except IndexError: # short row, the missing fields are reported by the parser
+            yield {name: row[i] for name, i in zip(fields, indexes) if i < len(row)}